@@ -0,0 +1,58 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+"""Compare typed lists with arrays for large numeric values.
+
+Run with ``python benchmarks/bench_array.py`` from the repository root.
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+from importlib.util import find_spec
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import environ  # noqa: E402
+
+
+def retained(func):
+    tracemalloc.start()
+    value = func()  # noqa: F841
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main(items=10000, number=50):
+    environ.Env.ENVIRON = {
+        'WEIGHTS': ','.join(str(i * 0.25) for i in range(items)),
+        'SHARDS': ','.join(str(i * 37) for i in range(items)),
+    }
+    env = environ.Env()
+    cases = [
+        ('list, float', lambda: env.list('WEIGHTS', cast=float)),
+        ('array, float', lambda: env.array('WEIGHTS')),
+        ('list, int', lambda: env.list('SHARDS', cast=int)),
+        ('array, int', lambda: env.array('SHARDS', 'q')),
+    ]
+    if find_spec('numpy'):
+        cases += [
+            ('numpy, float', lambda: env.array('WEIGHTS', numpy=True)),
+            ('numpy, int', lambda: env.array('SHARDS', 'q', numpy=True)),
+        ]
+    print(f'{items} items per value')
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        print(f'{name:<16}{best / number * 1e6:10.0f} us/call'
+              f'{retained(func) / 1024:10.0f} KiB')
+
+
+if __name__ == '__main__':
+    main()
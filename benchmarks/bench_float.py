@@ -0,0 +1,48 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+"""Measure the per-call cost of float casts.
+
+Plain values such as ``0.25`` take the ``float()`` fast path, values with
+locale separators such as ``1.234,5`` the separator fallback.
+
+Run with ``python benchmarks/bench_float.py`` from the repository root.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import environ  # noqa: E402
+
+
+def main(number=200000):
+    environ.Env.ENVIRON = {
+        'SAMPLE_RATE': '0.25',
+        'FACTORS': '0.5,1.5,2.5',
+        'PRICE': '1.234,5',
+    }
+    env = environ.Env()
+    cases = [
+        ('fast path', lambda: env.float('SAMPLE_RATE')),
+        ('fast path, list', lambda: env.list('FACTORS', cast=float)),
+        ('separator fallback', lambda: env.float('PRICE')),
+        ('parse_value, fast path',
+         lambda: env.parse_value('0.25', float)),
+        ('parse_value, fallback',
+         lambda: env.parse_value('1.234,5', float)),
+    ]
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        print(f'{name:<26}{best / number * 1e9:8.0f} ns/call')
+
+
+if __name__ == '__main__':
+    main()
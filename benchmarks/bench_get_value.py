@@ -0,0 +1,42 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+"""Measure the per-call cost of Env.get_value.
+
+Run with ``python benchmarks/bench_get_value.py`` from the repository root.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import environ  # noqa: E402
+
+
+def main(number=200000):
+    environ.Env.ENVIRON = {'INT_VAR': '42', 'STR_VAR': 'bar'}
+    env = environ.Env(
+        INT_VAR=int,
+        STR_VAR=(str, 'default'),
+        MISSING_VAR=(int, 0),
+    )
+    cases = [
+        ('scheme cast', lambda: env('INT_VAR')),
+        ('scheme cast and default', lambda: env('STR_VAR')),
+        ('scheme default', lambda: env('MISSING_VAR')),
+        ('no scheme', lambda: env('STR_VAR', cast=str, default='x')),
+    ]
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        print(f'{name:<26}{best / number * 1e9:8.0f} ns/call')
+
+
+if __name__ == '__main__':
+    main()
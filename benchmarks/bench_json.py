@@ -0,0 +1,49 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+"""Measure Env.json on a large value with each backend and cache mode.
+
+Run with ``python benchmarks/bench_json.py`` from the repository root.
+"""
+
+import json
+import os
+import sys
+import timeit
+from importlib.util import find_spec
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import environ  # noqa: E402
+
+
+def main(number=50):
+    routes = [
+        {'path': f'/api/v{i}', 'weights': [1, 2, 3], 'enabled': i % 2 == 0}
+        for i in range(2000)
+    ]
+    flags = {f'flag_{i}': i % 3 == 0 for i in range(2000)}
+    environ.Env.ENVIRON = {
+        'ROUTES': json.dumps({'routes': routes, 'flags': flags}),
+    }
+    env = environ.Env()
+    backends = [
+        name for name in environ.compat.JSON_BACKENDS if find_spec(name)
+    ]
+    for backend in backends:
+        environ.Env.JSON_BACKEND = backend
+        for mode in (None, 'copy', 'freeze'):
+            environ.Env.JSON_CACHE = mode
+            best = min(timeit.repeat(lambda: env.json('ROUTES'),
+                                     number=number, repeat=5))
+            name = f'{backend}, cache={mode}'
+            print(f'{name:<28}{best / number * 1e6:8.0f} us/call')
+
+
+if __name__ == '__main__':
+    main()
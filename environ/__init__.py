@@ -16,6 +16,9 @@ for details on the use of this package.
 """  # noqa: E501
 
 from .environ import *
+from .router import ReplicaRouter
+from .settings import Settings, Var
+from .watcher import EnvWatcher
 
 
 __copyright__ = 'Copyright (C) 2013-2023 Daniele Faraglia'
@@ -15,6 +15,9 @@ if find_spec('simplejson'):
 else:
     import json
 
+JSON_BACKENDS = ('orjson', 'ujson', 'simplejson', 'json')
+"""JSON libraries providing ``loads`` that can be used to decode values."""
+
 if find_spec('django'):
     from django import VERSION as DJANGO_VERSION
     from django.core.exceptions import ImproperlyConfigured
@@ -25,6 +28,17 @@ else:
         """Django is somehow improperly configured"""
 
 
+def choose_json_backend():
+    """Return the name of the JSON library used by default.
+
+    ``orjson`` and ``ujson`` decode some values differently from ``json``,
+    so they are never picked automatically.
+    """
+    if find_spec('simplejson'):
+        return 'simplejson'
+    return 'json'
+
+
 def choose_rediscache_driver():
     """Backward compatibility for RedisCache driver."""
 
@@ -66,3 +80,6 @@ DJANGO_POSTGRES = choose_postgres_driver()
 
 PYMEMCACHE_DRIVER = choose_pymemcache_driver()
 """The name of the Pymemcache driver."""
+
+JSON_BACKEND = choose_json_backend()
+"""The name of the JSON library used to decode values."""
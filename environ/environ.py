@@ -11,13 +11,29 @@ Django-environ allows you to utilize 12factor inspired environment
 variables to configure your Django application.
 """
 
+import array
 import ast
+import asyncio
+import bisect
+import builtins
+import copy
+import functools
+import glob
+import hashlib
+import importlib
 import itertools
 import logging
+import marshal
 import os
 import re
 import sys
+import tempfile
+import threading
 import warnings
+from collections import namedtuple, OrderedDict
+from collections.abc import Mapping, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from urllib.parse import (
     parse_qs,
     ParseResult,
@@ -32,24 +48,82 @@ from .compat import (
     DJANGO_POSTGRES,
     ImproperlyConfigured,
     json,
+    JSON_BACKEND,
     PYMEMCACHE_DRIVER,
     REDIS_DRIVER,
 )
 from .fileaware_mapping import FileAwareMapping
+from .lazy import LazyValue
 
 Openable = (str, os.PathLike)
 logger = logging.getLogger(__name__)
 
 
-def _cast(value):
-    # Safely evaluate an expression node or a string containing a Python
-    # literal or container display.
-    # https://docs.python.org/3/library/ast.html#ast.literal_eval
+_SCALAR_CONSTANTS = {'True': True, 'False': False, 'None': None}
+_BOOL_STRINGS = {
+    'true': True, 'on': True, 'ok': True, 'y': True, 'yes': True, '1': True,
+    'false': False, 'off': False, 'n': False, 'no': False, '0': False,
+}
+
+
+def _cast(value, hint=None):  # pylint: disable=too-many-return-statements
+    """Return the scalar written in a URL query option.
+
+    ``True``, ``False``, ``None``, integers, floats and quoted strings are
+    converted, as Python literals. Anything else, including containers such
+    as ``[1, 2]``, is returned as is. With a ``hint``, a type such as
+    ``int`` or ``bool``, values of that type are accepted in more forms,
+    e.g. ``on`` for ``bool``, and ``None`` is still accepted. Values that do
+    not match the hint are parsed as without it.
+    """
+    if hint is not None:
+        try:
+            return _cast_hinted(value, hint)
+        except (TypeError, ValueError, KeyError):
+            pass
     try:
-        return ast.literal_eval(value)
-    except (ValueError, SyntaxError):
+        return _SCALAR_CONSTANTS[value]
+    except (KeyError, TypeError):
+        pass
+    if not isinstance(value, str) or not value:
         return value
 
+    first = value[0]
+    last = value[-1]
+    if first in '0123456789+-.' and (last.isalnum() or last == '.'):
+        try:
+            if '.' in value:
+                return float(value)
+            return int(value, 0)
+        except ValueError:
+            pass
+        # Leading zeros, as in 010, are not valid in integer literals.
+        if 'e' in value or 'E' in value:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+    elif first in '\'"' and len(value) > 1 and value[-1] == first:
+        inner = value[1:-1]
+        if first not in inner and '\\' not in inner:
+            return inner
+        # Escapes and implicit concatenation, only for string literals.
+        try:
+            result = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value
+        if isinstance(result, str):
+            return result
+    return value
+
+
+def _cast_hinted(value, hint):
+    if value == 'None':
+        return None
+    if hint is bool:
+        return _BOOL_STRINGS[value.lower()]
+    return hint(value)
+
 
 def _cast_int(v):
     """Return int if possible."""
@@ -64,6 +138,500 @@ def _urlparse_quote(url):
     return urlparse(quote(url, safe=':/?&=@'))
 
 
+_DSN_SCHEME_RE = re.compile(r'([A-Za-z][A-Za-z0-9+.-]*)://')
+_DSN_NETLOC_END_RE = re.compile(r'[/?#]')
+_DSN_LITERAL_NETLOC_END_RE = re.compile(r'[/?]')
+_DSN_PORT_RE = re.compile(r'[0-9]+')
+
+
+class _DSN:  # pylint: disable=too-many-instance-attributes
+    """The parts of a database URL used by ``Env.db_url_config``.
+
+    ``username``, ``password``, ``path`` and ``query`` are still quoted,
+    ``port`` is the raw port string, see :func:`_dsn_port`.
+    """
+
+    __slots__ = ('scheme', 'netloc', 'path', 'query', 'username',
+                 'password', 'hostname', 'port')
+
+    def __init__(self, scheme, netloc, path, query):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.path = path
+        self.query = query
+
+        userinfo, has_userinfo, hostinfo = netloc.rpartition('@')
+        if ('[' in hostinfo) != (']' in hostinfo):
+            raise ValueError('Invalid IPv6 URL')
+        if has_userinfo:
+            self.username, has_password, password = userinfo.partition(':')
+            self.password = password if has_password else None
+        else:
+            self.username = self.password = None
+
+        _, bracket, bracketed = hostinfo.partition('[')
+        if bracket:
+            hostname, _, port = bracketed.partition(']')
+            port = port.partition(':')[2]
+        else:
+            hostname, _, port = hostinfo.partition(':')
+        # Like urllib, keep the case of an IPv6 zone ID.
+        hostname, percent, zone = hostname.partition('%')
+        self.hostname = hostname.lower() + percent + zone or None
+        self.port = port or None
+
+    @classmethod
+    def from_parse_result(cls, url):
+        """Return the parts of a :class:`urllib.parse.ParseResult`."""
+        if not url.path:
+            url = _urlparse_quote(urlunparse(url))
+        dsn = cls(url.scheme, url.netloc, url.path, url.query)
+        dsn.port = url.port
+        return dsn
+
+
+def _parse_dsn(url):
+    """Split a ``scheme://netloc/path?query`` database URL in one pass.
+
+    The network location normally ends at the first ``/``, ``?`` or ``#``.
+    When that leaves no path, or unbalanced brackets in the location, the
+    user info must contain one of those characters, like a password with a
+    ``#`` or a ``]``, and the location runs to the first ``/`` or ``?``
+    instead, with ``#`` taken literally; ``/`` and ``?`` must always be
+    quoted. Returns None for strings that do not start with a scheme and
+    ``://``.
+    """
+    match = _DSN_SCHEME_RE.match(url)
+    if match is None:
+        return None
+    rest = url[match.end():]
+
+    end = _DSN_NETLOC_END_RE.search(rest)
+    end = end.start() if end else len(rest)
+    netloc = rest[:end]
+    if rest[end:end + 1] == '/' and ('[' in netloc) == (']' in netloc):
+        # The fragment, if any, is ignored.
+        remainder = rest[end:].partition('#')[0]
+    else:
+        end = _DSN_LITERAL_NETLOC_END_RE.search(rest)
+        end = end.start() if end else len(rest)
+        netloc = rest[:end]
+        remainder = rest[end:]
+    path, _, query = remainder.partition('?')
+    return _DSN(match.group(1).lower(), netloc, path, query)
+
+
+def _dsn_port(port):
+    """Return the port of a :class:`_DSN` as an int, or None."""
+    if port is None or isinstance(port, int):
+        return port
+    if not _DSN_PORT_RE.fullmatch(port):
+        raise ValueError(f'Port could not be cast to integer value as '
+                         f'{port!r}')
+    port = int(port)
+    if port > 65535:
+        raise ValueError('Port out of range 0-65535')
+    return port
+
+
+# Built-in casts of Env.parse_value. Each handler is called with the Env
+# class, the raw value and the cast.
+
+def _parse_bool(cls, value, _type):
+    try:
+        return int(value) != 0
+    except ValueError:
+        return value.lower().strip() in cls.BOOLEAN_TRUE_STRINGS
+
+
+_FLOAT_NOISE_RE = re.compile(r'[^\d,.-]')
+_FLOAT_SEPARATOR_RE = re.compile(r'[,.]')
+
+
+def _parse_float(cls, value, _type):
+    try:
+        return float(value)
+    except ValueError:
+        if not cls.FLOAT_SEPARATOR_FALLBACK:
+            raise
+    # clean string
+    float_str = _FLOAT_NOISE_RE.sub('', value)
+    # split for avoid thousand separator and different
+    # locale comma/dot symbol
+    parts = _FLOAT_SEPARATOR_RE.split(float_str)
+    if len(parts) == 1:
+        float_str = parts[0]
+    else:
+        float_str = f"{''.join(parts[0:-1])}.{parts[-1]}"
+    return float(float_str)
+
+
+def _parse_dict(_cls, value, _type):
+    return dict([v.split('=', 1) for v in value.split(',') if v])
+
+
+def _parse_list(_cls, value, _type):
+    return [x for x in value.split(',') if x]
+
+
+def _parse_tuple(_cls, value, _type):
+    val = value.strip('(').strip(')').split(',')
+    # pylint: disable=consider-using-generator
+    return tuple([x for x in val if x])
+
+
+def _item_cast(cls, cast):
+    # Items are cast directly, unless a parser is registered for their type.
+    return cls.CAST_PARSERS.get(cast, cast)
+
+
+def _parse_typed_list(cls, value, cast):
+    item_cast = _item_cast(cls, cast[0])
+    return list(map(item_cast, [x for x in value.split(',') if x]))
+
+
+def _parse_typed_tuple(cls, value, cast):
+    val = value.strip('(').strip(')').split(',')
+    return tuple(map(_item_cast(cls, cast[0]), [x for x in val if x]))
+
+
+_DICT_PLAIN_RE = re.compile(r'[^;=\\"\']+')
+_DICT_QUOTED_RE = re.compile(
+    r'"((?:[^"\\]|\\.)*)"|\'((?:[^\'\\]|\\.)*)\'', re.DOTALL
+)
+_DICT_QUOTED_ESCAPE_RE = re.compile(r'\\([\\"\'])')
+_DICT_ESCAPABLE = frozenset(';=\\"\'')
+
+
+def _iter_dict_entries(value):  # pylint: disable=too-many-statements
+    """Yield the ``(key, value)`` pairs of a ``key=value;...`` string.
+
+    The string is scanned once. Only the first ``=`` of an entry separates
+    the key from the value. A key or value starting with a quote extends to
+    the matching quote, and may contain ``;`` and ``=``. A backslash
+    escapes the next character when it is ``;``, ``=``, a quote or a
+    backslash, and is kept as is otherwise. Empty entries are skipped.
+    """
+    if '\\' not in value and '"' not in value and "'" not in value:
+        # Nothing to unquote, let str methods do the scanning.
+        for entry in value.split(';'):
+            if entry:
+                key, separator, item = entry.partition('=')
+                if not separator:
+                    raise ValueError(
+                        f'Invalid dict entry {entry!r}, expected key=value'
+                    )
+                yield key, item
+        return
+
+    pos = 0
+    end = len(value)
+    key = None
+    parts = []
+    # Quotes with no closing quote until the end, which would otherwise be
+    # searched for again at every entry.
+    unclosed = set()
+    while pos <= end:
+        char = value[pos] if pos < end else ';'
+        if char == ';':
+            if key is not None:
+                yield key, ''.join(parts)
+            elif parts:
+                raise ValueError(
+                    f'Invalid dict entry {"".join(parts)!r}, '
+                    f'expected key=value'
+                )
+            key = None
+            parts = []
+            pos += 1
+        elif char == '=':
+            if key is None:
+                key = ''.join(parts)
+                parts = []
+            else:
+                parts.append(char)
+            pos += 1
+        elif char == '\\':
+            if pos + 1 < end and value[pos + 1] in _DICT_ESCAPABLE:
+                parts.append(value[pos + 1])
+                pos += 2
+            else:
+                parts.append(char)
+                pos += 1
+        elif char in '"\'':
+            if parts or char in unclosed:
+                match = None
+            else:
+                match = _DICT_QUOTED_RE.match(value, pos)
+                if match is None:
+                    unclosed.add(char)
+            if match is None:
+                # A quote inside a key or value, or an unterminated one.
+                parts.append(char)
+                pos += 1
+            else:
+                quoted = match.group(1 if char == '"' else 2)
+                parts.append(_DICT_QUOTED_ESCAPE_RE.sub(r'\1', quoted))
+                pos = match.end()
+        else:
+            match = _DICT_PLAIN_RE.match(value, pos)
+            parts.append(match.group())
+            pos = match.end()
+
+
+def _compile_cast(cls, cast):
+    """Return a callable applying ``cast`` as ``cls.parse_value`` does."""
+    if cast is None:
+        return str
+    if type(cast) not in _CAST_INSTANCE_HANDLERS:
+        try:
+            parser = cls.CAST_PARSERS.get(cast)
+        except TypeError:  # unhashable cast
+            parser = None
+        else:
+            if parser is not None:
+                return parser
+            if cast not in _CAST_HANDLERS and callable(cast):
+                return cast
+    return functools.partial(cls.parse_value, cast=cast)
+
+
+def _freeze(value):
+    """Return a read-only view of nested dicts and lists."""
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {key: _freeze(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _dump_copy(value):
+    """Store ``value`` so that _load_copy() can build new copies of it."""
+    try:
+        # Unmarshalling is as fast as the fastest JSON libraries and builds
+        # a new object tree on every call.
+        return True, marshal.dumps(value)
+    except ValueError:
+        return False, value
+
+
+def _load_copy(dumped):
+    marshalled, value = dumped
+    return marshal.loads(value) if marshalled else copy.deepcopy(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _json_decoder(backend, mode, maxsize):
+    """Return the ``loads`` function used by ``Env.json``.
+
+    The same function is returned for the same options, so it can be part of
+    the key of cached values.
+    """
+    loads = importlib.import_module(backend).loads
+    if mode is None:
+        return loads
+    if mode == 'freeze':
+        return functools.lru_cache(maxsize)(lambda raw: _freeze(loads(raw)))
+    if mode != 'copy':
+        raise ImproperlyConfigured(
+            f"Invalid JSON cache mode {mode!r}, use 'copy', 'freeze' or None"
+        )
+    decode = functools.lru_cache(maxsize)(lambda raw: _dump_copy(loads(raw)))
+    return lambda raw: _load_copy(decode(raw))
+
+
+def _parse_typed_dict(cls, value, cast):
+    key_cast = _item_cast(cls, cast.get('key', str))
+    value_cast = _compile_cast(cls, cast.get('value', str))
+    # Casts are resolved once per call, not once per entry.
+    value_cast_by_key = {
+        key: _compile_cast(cls, item_cast)
+        for key, item_cast in cast.get('cast', {}).items()
+    }.get
+    return {
+        key_cast(key): value_cast_by_key(key, value_cast)(item)
+        for key, item in _iter_dict_entries(value)
+    }
+
+
+# Handlers for casts given as a type.
+_CAST_HANDLERS = {
+    bool: _parse_bool,
+    float: _parse_float,
+    dict: _parse_dict,
+    list: _parse_list,
+    tuple: _parse_tuple,
+}
+
+# Handlers for casts given as an instance, such as ``[int]``, keyed by the
+# type of the instance.
+_CAST_INSTANCE_HANDLERS = {
+    list: _parse_typed_list,
+    tuple: _parse_typed_tuple,
+    dict: _parse_typed_dict,
+}
+
+
+def _invalid_variables_error(errors):
+    """Return one error describing all ``{var: exception}`` of ``errors``."""
+    error = ImproperlyConfigured(
+        'Invalid environment variables: ' + '; '.join(
+            f'{var}: {exc}' for var, exc in errors.items()
+        )
+    )
+    error.errors = errors
+    return error
+
+
+def _default_env_file(depth):
+    """Return the ``.env`` file next to the module of a calling frame.
+
+    ``depth`` is given to :func:`sys._getframe` from here, so ``2`` is the
+    caller of the function calling this one. Returns None, after logging
+    it, when the file does not exist.
+    """
+    # pylint: disable=protected-access
+    frame = sys._getframe(depth)
+    env_file = os.path.join(
+        os.path.dirname(frame.f_code.co_filename),
+        '.env'
+    )
+    if not os.path.exists(env_file):
+        logger.info(
+            "%s doesn't exist - if you're not configuring your "
+            "environment separately, create one.", env_file)
+        return None
+    return env_file
+
+
+async def _run_in_executor(func, *args, **kwargs):
+    """Run ``func`` in the default executor of the running event loop."""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(func, *args, **kwargs)
+    )
+
+
+_ENV_KEY_CHARS = frozenset(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_'
+)
+
+
+def _find_closing_quote(value, opening):
+    """Return the index of the quote closing a single-quoted value.
+
+    The closing quote is the last ``'`` that is followed by nothing but
+    whitespace and an optional ``#`` comment. Return ``None`` if there is
+    no such quote.
+    """
+    following = ''
+    for index in range(len(value) - 1, opening, -1):
+        char = value[index]
+        if char == "'" and following in ('', '#'):
+            return index
+        if not char.isspace():
+            following = char
+    return None
+
+
+def _unescape_env_value(value):
+    """Unescape backslash sequences of a double-quoted value.
+
+    Escaped newlines and tabs (``\\n``, ``\\r``, ``\\t``) are kept as is,
+    any other escaped character is replaced by the character itself.
+    """
+    index = value.find('\\')
+    if index == -1:
+        return value
+
+    parts = []
+    start = 0
+    while index != -1 and index + 1 < len(value):
+        parts.append(value[start:index])
+        char = value[index + 1]
+        parts.append('\\' + char if char in 'rnt' else char)
+        start = index + 2
+        index = value.find('\\', start)
+    parts.append(value[start:])
+    return ''.join(parts)
+
+
+def _read_env_content(env_file, encoding, max_size=None):
+    """Return the content of a dotenv path or file object.
+
+    At most one character more than ``max_size`` is read.
+    """
+    size = -1 if max_size is None else max_size + 1
+    if isinstance(env_file, Openable):
+        # Python 3.5 support (wrap path with str).
+        with open(str(env_file), encoding=encoding) as f:
+            content = f.read(size)
+    else:
+        with env_file as f:
+            content = f.read(size)
+    logger.debug('Read environment variables from: %s', env_file)
+    return content
+
+
+def _env_file_size_error(env_file, max_size):
+    return ImproperlyConfigured(
+        f'{env_file} exceeds the maximum size of {max_size} characters'
+    )
+
+
+def _env_line_size_error(env_file, lineno, max_size):
+    return ImproperlyConfigured(
+        f'Line {lineno} of {env_file} exceeds the maximum size of '
+        f'{max_size} characters'
+    )
+
+
+def _iter_env_chunks(env_file, encoding):
+    """Yield the lines of a dotenv path, file object or iterable of lines."""
+    if isinstance(env_file, Openable):
+        with open(str(env_file), encoding=encoding) as f:
+            yield from f
+    elif hasattr(env_file, '__enter__'):
+        with env_file as f:
+            yield from f
+    else:
+        yield from env_file
+
+
+def _parse_env_line(line):
+    """Tokenize a single line of a dotenv file.
+
+    Return a ``(key, value)`` tuple, or ``None`` if the line does not
+    assign a variable. Single-quoted values may contain ``#``, trailing
+    comments are ignored and double-quoted values are unescaped. Every
+    step is a single scan over the line, so the cost stays linear in its
+    length.
+    """
+    start = 7 if line.startswith('export ') else 0
+    equals = line.find('=', start)
+    if equals <= start:
+        return None
+    key = line[start:equals]
+    if not _ENV_KEY_CHARS.issuperset(key):
+        return None
+
+    value = line[equals + 1:]
+    opening = len(value) - len(value.lstrip())
+    closing = None
+    if value.startswith("'", opening):
+        closing = _find_closing_quote(value, opening)
+    if closing is not None:
+        value = value[opening + 1:closing]
+    else:
+        value = value.partition('#')[0]
+
+    if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+        value = _unescape_env_value(value[1:-1])
+    return key, value
+
+
 class NoValue:
     """Represent of no value object."""
 
@@ -71,7 +639,400 @@ class NoValue:
         return f'<{self.__class__.__name__}>'
 
 
-class Env:
+class _SchemeEntry:
+    """The cast and default declared for a variable in an :class:`Env`
+    scheme, resolved once when the scheme is set."""
+
+    __slots__ = ('name', 'var_info', 'cast', 'default')
+
+    def __init__(self, name, var_info, notset):
+        self.name = name
+        self.var_info = var_info
+        try:
+            has_default = len(var_info) == 2
+        except TypeError:
+            has_default = False
+
+        if has_default:
+            self.cast, self.default = var_info[0], var_info[1]
+        else:
+            self.cast, self.default = var_info, notset
+
+
+class FrozenEnviron(dict):
+    """A read-only, hashable copy of an environment mapping.
+
+    Lookups are plain :class:`dict` lookups, while every method that would
+    change the content raises :class:`TypeError`. Two snapshots can be
+    compared with ``==`` or diffed through their ``items()``.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f'{self.__class__.__name__} is read-only')
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            # pylint: disable=attribute-defined-outside-init
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({dict.__repr__(self)})'
+
+    def __missing__(self, key):
+        # Secrets that could not be read when the copy was taken raise
+        # their error again, see Env.snapshot().
+        errors = self.__dict__.get('errors', {})
+        if key in errors:
+            raise copy.copy(errors[key])
+        raise KeyError(key)
+
+    @classmethod
+    def _from_environ(cls, environ):
+        """Copy ``environ``, keeping the errors of unreadable ``_FILE``
+        secrets to raise them when those variables are looked up."""
+        values = {}
+        errors = {}
+        for key in environ:
+            try:
+                values[key] = environ[key]
+            except OSError as exc:
+                errors[key] = exc
+        frozen = cls(values)
+        if errors:
+            # pylint: disable=attribute-defined-outside-init
+            frozen.errors = errors
+        return frozen
+
+
+class _ReadOnceEnviron(Mapping):
+    """A read-through view of an environment mapping.
+
+    Every key is read from the wrapped mapping at most once, so values stay
+    consistent while several variables are resolved. Keys that are never
+    looked up are never read.
+    """
+
+    def __init__(self, environ):
+        self.environ = environ
+        self.values = {}
+        self.missing = set()
+
+    def __getitem__(self, key):
+        try:
+            return self.values[key]
+        except KeyError:
+            if key in self.missing:
+                raise
+        try:
+            value = self.values[key] = self.environ[key]
+        except KeyError:
+            self.missing.add(key)
+            raise
+        return value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self.environ)
+
+    def __len__(self):
+        return len(self.environ)
+
+
+class _EnvironOverlay(MutableMapping):
+    """An in-memory layer over an environment mapping.
+
+    Writes go to ``layer``. Deleting a key removes it from the layer and
+    hides it in ``environ`` below, which is never changed. :meth:`copy`
+    returns a plain dict of all visible variables, as ``os.environ.copy()``
+    does.
+    """
+
+    def __init__(self, environ, previous):
+        self.layer = {}
+        self.environ = environ
+        self.hidden = set()
+        # The ENVIRON class attribute to restore, see Env.remove_overlay().
+        self.previous = previous
+
+    def __getitem__(self, key):
+        if key in self.layer:
+            return self.layer[key]
+        if key in self.hidden:
+            raise KeyError(key)
+        return self.environ[key]
+
+    def __contains__(self, key):
+        return key in self.layer or (
+            key not in self.hidden and key in self.environ
+        )
+
+    def __iter__(self):
+        yield from self.layer
+        for key in self.environ:
+            if key not in self.layer and key not in self.hidden:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __setitem__(self, key, value):
+        self.layer[key] = value
+        self.hidden.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.layer.pop(key, None)
+        self.hidden.add(key)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.layer!r}, {self.environ!r})'
+
+    def copy(self):
+        """Return the visible variables in a dict."""
+        return dict(self)
+
+
+def _environ_size(environ):
+    """Return a number that changes when keys are added to or removed from
+    ``environ``, without iterating it.
+
+    It is the length for plain mappings, and that of the wrapped mappings
+    for :class:`FileAwareMapping` and overlays, whose own length has to scan
+    every key.
+    """
+    if isinstance(environ, FileAwareMapping):
+        return _environ_size(environ.env)
+    if isinstance(environ, _EnvironOverlay):
+        return (len(environ.layer) + len(environ.hidden)
+                + _environ_size(environ.environ))
+    return len(environ)
+
+
+URLConfigCacheInfo = namedtuple(
+    'URLConfigCacheInfo', ['hits', 'misses', 'maxsize', 'currsize']
+)
+
+
+class URLConfigCache:
+    """A bounded, thread-safe LRU cache for parsed URL configs.
+
+    :class:`Env` keeps one in :attr:`Env.url_config_cache`, shared by the
+    ``*_url_config`` methods, see :attr:`Env.URL_CONFIG_CACHE`.
+    """
+
+    def __init__(self, maxsize=256):
+        """
+        :param int maxsize: Number of configs kept, the least recently used
+            ones are dropped first.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        """Return the entry stored for ``key``, or None."""
+        with self._lock:
+            try:
+                entry = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        """Store ``entry`` for ``key``, evicting the oldest entries."""
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > max(self.maxsize, 0):
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        """Return the hit and miss counts and the size of the cache.
+
+        :rtype: URLConfigCacheInfo
+        """
+        with self._lock:
+            return URLConfigCacheInfo(self.hits, self.misses, self.maxsize,
+                                      len(self._data))
+
+
+# Set by URL parsers that warn, so that their configs are not cached and the
+# warning is given again on the next call.
+_url_config_state = threading.local()
+
+
+def _url_config_warning(message):
+    """Mark the config being parsed as not cacheable, return ``message``."""
+    _url_config_state.warned = True
+    return message
+
+
+def _table_key(value):
+    """Return a hashable key for the content of a class table."""
+    if isinstance(value, dict):
+        return tuple(value.items())
+    if isinstance(value, (list, set)):
+        return tuple(value)
+    return value
+
+
+def _cached_url_config(*tables):
+    """Serve the configs parsed by the decorated method from
+    ``cls.url_config_cache``.
+
+    ``tables`` name the class attributes the method reads, such as
+    ``DB_SCHEMES``. Their content is part of the key, so changing them does
+    not return configs parsed before.
+    """
+    tables += ('URL_CLASS',)
+
+    def decorator(func):
+        name = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(cls, url, *args, **kwargs):
+            mode = cls.URL_CONFIG_CACHE
+            if mode is None:
+                return func(cls, url, *args, **kwargs)
+            if mode not in ('copy', 'freeze'):
+                raise ImproperlyConfigured(
+                    f"Invalid URL config cache mode {mode!r}, use 'copy', "
+                    f"'freeze' or None"
+                )
+            key = (
+                cls, name, mode, url, args, tuple(sorted(kwargs.items())),
+                tuple(_table_key(getattr(cls, table)) for table in tables),
+            )
+            try:
+                entry = cls.url_config_cache.get(key)
+            except TypeError:  # unhashable argument
+                return func(cls, url, *args, **kwargs)
+
+            if entry is None:
+                _url_config_state.warned = False
+                config = func(cls, url, *args, **kwargs)
+                if _url_config_state.warned:
+                    # Keep warning on every call.
+                    return config
+                entry = _freeze(config) if mode == 'freeze' else \
+                    _dump_copy(config)
+                cls.url_config_cache.put(key, entry)
+            return entry if mode == 'freeze' else _load_copy(entry)
+
+        return wrapper
+
+    return decorator
+
+
+class ArrayCast:
+    """Cast a comma-separated list of numbers to a compact array.
+
+    Items are stored as machine values in an :class:`array.array` of the
+    given ``typecode``, or in a :class:`numpy.ndarray` of that dtype with
+    ``numpy=True``, instead of one Python object per item. Empty items are
+    skipped, as with ``env.list``.
+
+    Casts compare equal when their options are equal, so they can be used in
+    a scheme and as keys of cached values.
+    """
+
+    __slots__ = ('typecode', 'numpy', '_item_cast')
+
+    def __init__(self, typecode='d', numpy=False):
+        """
+        :param typecode: An :mod:`array` typecode, such as ``'d'`` for
+            floats or ``'q'`` for 64-bit integers.
+        :param numpy: Return a :class:`numpy.ndarray` instead.
+        """
+        self.typecode = typecode
+        self.numpy = numpy
+        self._item_cast = float if typecode in 'fd' else int
+
+    def __call__(self, value):
+        if not self.numpy:
+            items = filter(None, value.split(','))
+            # array() copies from a list faster than from an iterator.
+            return array.array(self.typecode,
+                               list(map(self._item_cast, items)))
+        try:
+            # pylint: disable=import-outside-toplevel
+            import numpy
+        except ImportError:
+            raise ImproperlyConfigured(
+                'NumPy is required to cast values to numpy arrays'
+            ) from None
+
+        if self._item_cast is int:
+            # numpy.fromstring() silently wraps integers that do not fit
+            # the dtype, so they are parsed in Python and range checked
+            # as array.array() does.
+            items = list(map(int, filter(None, value.split(','))))
+            info = numpy.iinfo(self.typecode)
+            if items and (min(items) < info.min or max(items) > info.max):
+                raise OverflowError(
+                    f'{value!r} does not fit in an array of '
+                    f'{self.typecode!r}'
+                )
+            return numpy.array(items, dtype=self.typecode)
+
+        text = value.strip().strip(',')
+        if ',,' in text:
+            text = ','.join(x for x in text.split(',') if x)
+        # NumPy parses the whole string in C. Older versions stop at the
+        # first invalid item with a DeprecationWarning instead of failing.
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            result = numpy.fromstring(text, dtype=self.typecode, sep=',')
+        if result.size != (text.count(',') + 1 if text else 0):
+            raise ValueError(
+                f'could not convert {value!r} to an array of '
+                f'{self.typecode!r}'
+            )
+        return result
+
+    def __eq__(self, other):
+        if not isinstance(other, ArrayCast):
+            return NotImplemented
+        return (self.typecode, self.numpy) == (other.typecode, other.numpy)
+
+    def __hash__(self):
+        return hash((ArrayCast, self.typecode, self.numpy))
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.typecode!r}, numpy={self.numpy})'
+
+
+class Env:  # pylint: disable=too-many-instance-attributes
     """Provide scheme-based lookups of environment variables so that each
     caller doesn't have to pass in ``cast`` and ``default`` parameters.
 
@@ -106,9 +1067,34 @@ class Env:
     BOOLEAN_TRUE_STRINGS = ('true', 'on', 'ok', 'y', 'yes', '1')
     URL_CLASS = ParseResult
 
+    # Parsers of the raw value, keyed by cast. See register_cast().
+    CAST_PARSERS = {}
+
+    # Whether ``float`` casts accept values that ``float()`` rejects, such
+    # as ``1,5`` or ``1.234.567,8``, by treating the last ``,`` or ``.`` as
+    # the decimal separator and dropping other separators and characters.
+    FLOAT_SEPARATOR_FALLBACK = True
+
+    # The JSON library used by ``json()``, see ``compat.JSON_BACKENDS``.
+    JSON_BACKEND = JSON_BACKEND
+    # How ``json()`` returns values decoded before from the same string:
+    # 'copy' returns a new deep copy, 'freeze' a shared read-only view with
+    # tuples for lists, None decodes the string again.
+    JSON_CACHE = 'copy'
+    JSON_CACHE_SIZE = 128
+
+    # How the *_url_config methods return configs parsed before from the
+    # same arguments, see url_config_cache: 'copy' returns a new deep copy,
+    # 'freeze' a shared read-only view with tuples for lists, None parses
+    # the URL again.
+    URL_CONFIG_CACHE = 'copy'
+    url_config_cache = URLConfigCache()
+
     POSTGRES_FAMILY = ['postgres', 'postgresql', 'psql', 'pgsql', 'postgis']
 
     DEFAULT_DATABASE_ENV = 'DATABASE_URL'
+    DEFAULT_DATABASE_ALIAS = 'default'
+    DEFAULT_REPLICA_PREFIX = 'replica'
     DB_SCHEMES = {
         'postgres': DJANGO_POSTGRES,
         'postgresql': DJANGO_POSTGRES,
@@ -133,7 +1119,20 @@ class Env:
         'AUTOCOMMIT',
         'DISABLE_SERVER_SIDE_CURSORS',
         'CONN_HEALTH_CHECKS',
+        'WEIGHT',
     ]
+    # Types of the query options of database URLs, for _cast(). The builtins
+    # are named explicitly as Env defines methods called int, bool and str.
+    DB_OPTION_TYPES = {
+        'CONN_MAX_AGE': builtins.int,
+        'ATOMIC_REQUESTS': builtins.bool,
+        'AUTOCOMMIT': builtins.bool,
+        'DISABLE_SERVER_SIDE_CURSORS': builtins.bool,
+        'CONN_HEALTH_CHECKS': builtins.bool,
+        'WEIGHT': builtins.int,
+    }
+    # Query options that databases() also reads from <var>_<ALIAS>_<OPTION>.
+    DB_SIBLING_OPTIONS = ('REPLICA_OF', 'WEIGHT', 'TARGET_SESSION_ATTRS')
 
     DEFAULT_CACHE_ENV = 'CACHE_URL'
     CACHE_SCHEMES = {
@@ -155,6 +1154,15 @@ class Env:
         'KEY_FUNCTION',
         'BINARY',
     ]
+    # Types of the query options of cache URLs, for _cast().
+    CACHE_OPTION_TYPES = {
+        'KEY_PREFIX': builtins.str,
+        'VERSION': builtins.int,
+        'KEY_FUNCTION': builtins.str,
+        'BINARY': builtins.bool,
+        'MAX_ENTRIES': builtins.int,
+        'CULL_FREQUENCY': builtins.int,
+    }
 
     DEFAULT_EMAIL_ENV = 'EMAIL_URL'
     EMAIL_SCHEMES = {
@@ -189,11 +1197,70 @@ class Env:
                             for s in ('', 's')]
     CLOUDSQL = 'cloudsql'
 
+    # Upper bounds, in characters, for what ``read_env`` accepts from a
+    # single file and a single line. ``None`` disables the check.
+    READ_ENV_MAX_FILE_SIZE = None
+    READ_ENV_MAX_LINE_SIZE = None
+
+    # Incremented by every change to the environment made through Env, see
+    # environ_changed().
+    _environ_version = 0
+    _environ_index = (None, None, ())
+
     def __init__(self, **scheme):
         self.smart_cast = True
         self.escape_proxy = False
         self.prefix = ""
         self.scheme = scheme
+        self.cache_values = False
+        self._lazy_values = {}
+        self._values_cache = {}
+        self._values_cache_state = (None, None, None)
+        self._scope_index = None
+
+    @property
+    def scheme(self):
+        """The casts and defaults of variables, as given to the constructor.
+
+        Assigning a new scheme compiles it again. Entries added or replaced
+        in the dict in place are compiled when they are first looked up.
+        """
+        return self._scheme
+
+    @scheme.setter
+    def scheme(self, scheme):
+        self._scheme = scheme
+        self._values_cache = {}
+        self._scheme_entries = {
+            name: _SchemeEntry(name, var_info, self.NOTSET)
+            for name, var_info in scheme.items()
+        }
+
+    def _scheme_entry(self, var_name):
+        """Return the compiled scheme entry of ``var_name``, or None."""
+        var_info = self._scheme.get(var_name, self.NOTSET)
+        entry = self._scheme_entries.get(var_name)
+        if var_info is self.NOTSET:
+            if entry is not None:
+                # Removed from the scheme in place.
+                del self._scheme_entries[var_name]
+                self._values_cache = {}
+            return None
+        if entry is None or entry.var_info is not var_info:
+            entry = _SchemeEntry(var_name, var_info, self.NOTSET)
+            self._scheme_entries[var_name] = entry
+            self._values_cache = {}
+        return entry
+
+    def __copy__(self):
+        env = self.__class__.__new__(self.__class__)
+        env.__dict__.update(self.__dict__)
+        # Each copy compiles the scheme entries it looks up itself, so that
+        # _scheme_entry() notices changes for its own cache.
+        env._scheme_entries = dict(  # pylint: disable=protected-access
+            self._scheme_entries
+        )
+        return env
 
     def __call__(self, var, cast=None, default=NOTSET, parse_default=False):
         return self.get_value(
@@ -204,7 +1271,95 @@ class Env:
         )
 
     def __contains__(self, var):
-        return var in self.ENVIRON
+        return f'{self.prefix}{var}' in self.ENVIRON
+
+    def __iter__(self):
+        """Iterate the names of the variables starting with ``prefix``,
+        without the prefix."""
+        return iter(self._scope_keys())
+
+    def __getitem__(self, var):
+        """Return the raw value of ``var``, looked up with ``prefix``."""
+        return self.ENVIRON[f'{self.prefix}{var}']
+
+    def keys(self):
+        """Return the names of the variables starting with ``prefix``,
+        without the prefix.
+
+        Together with item access this lets ``dict(env)`` export the raw
+        values of a scope.
+
+        :rtype: tuple
+        """
+        return self._scope_keys()
+
+    def scoped(self, prefix):
+        """Return a child :class:`Env` for the variables starting with
+        ``prefix``.
+
+        The child shares the environment, scheme and settings of this
+        instance, and its ``prefix`` is appended to the current one, so
+        scopes can be nested:
+
+        .. code-block:: python
+
+            celery = env.scoped('CELERY_')
+            celery.int('WORKER_CONCURRENCY')  # CELERY_WORKER_CONCURRENCY
+            dict(celery)                       # {'WORKER_CONCURRENCY': '4'}
+            celery.scoped('BROKER_')           # CELERY_BROKER_...
+
+        The names of the environment are sorted once per version of the
+        environment (see :meth:`environ_changed`) and shared by all scopes,
+        each of which then finds its own names with a binary search. They are
+        sorted again when the number of variables changes or a name of the
+        scope is no longer set.
+
+        :rtype: Env
+        """
+        env = copy.copy(self)
+        env.prefix = f'{self.prefix}{prefix}'
+        # pylint: disable=protected-access
+        env._lazy_values = {}
+        env._values_cache = {}
+        env._values_cache_state = (None, None, None)
+        env._scope_index = None
+        return env
+
+    @classmethod
+    def _sorted_environ_keys(cls, environ, state, refresh=False):
+        index = Env._environ_index
+        if refresh or index[0] is not environ or index[1] != state:
+            index = Env._environ_index = (environ, state, sorted(environ))
+        return index[2]
+
+    def _scope_keys(self):
+        environ = self.ENVIRON
+        # Variables set or deleted in ENVIRON directly do not bump the
+        # version, so the index is also checked against the live mapping.
+        state = (Env._environ_version, _environ_size(environ))
+        prefix = self.prefix
+        index = self._scope_index
+        if index is None or index[0] is not environ or index[1] != state:
+            index = self._scope_index = (
+                environ, state, self._scan_scope(environ, state)
+            )
+        if not all(f'{prefix}{key}' in environ for key in index[2]):
+            index = self._scope_index = (
+                environ, state, self._scan_scope(environ, state, True)
+            )
+        return index[2]
+
+    def _scan_scope(self, environ, state, refresh=False):
+        names = self._sorted_environ_keys(environ, state, refresh)
+        prefix = self.prefix
+        start = len(prefix)
+        keys = []
+        for name in itertools.islice(
+                names, bisect.bisect_left(names, prefix), None):
+            if not name.startswith(prefix):
+                break
+            keys.append(name[start:])
+        return tuple(keys)
 
     def str(self, var, default=NOTSET, multiline=False):
         """
@@ -238,15 +1393,32 @@ class Env:
 
     def float(self, var, default=NOTSET):
         """
+        Values that :func:`float` rejects, such as ``1.234,5``, are parsed
+        with the separator fallback, unless
+        :attr:`FLOAT_SEPARATOR_FALLBACK` is disabled.
+
         :rtype: float
         """
         return self.get_value(var, cast=float, default=default)
 
     def json(self, var, default=NOTSET):
         """
+        The value is decoded with :attr:`JSON_BACKEND`. Decoded values are
+        cached by raw string according to :attr:`JSON_CACHE`.
+
         :returns: Json parsed
         """
-        return self.get_value(var, cast=json.loads, default=default)
+        return self.get_value(var, cast=self.json_cast(), default=default)
+
+    @classmethod
+    def json_cast(cls):
+        """Return the cast used by :meth:`json`, for use in a scheme.
+
+        The cast follows the :attr:`JSON_BACKEND`, :attr:`JSON_CACHE` and
+        :attr:`JSON_CACHE_SIZE` settings at the time of the call.
+        """
+        return _json_decoder(cls.JSON_BACKEND, cls.JSON_CACHE,
+                             cls.JSON_CACHE_SIZE)
 
     def list(self, var, cast=None, default=NOTSET):
         """
@@ -268,6 +1440,25 @@ class Env:
             default=default
         )
 
+    def array(self, var, typecode='d', default=NOTSET, numpy=False):
+        """
+        Return a comma-separated list of numbers as a compact array, see
+        :class:`ArrayCast`.
+
+        :param typecode: An :mod:`array` typecode, ``'d'`` (float) by
+            default.
+        :param numpy: Return a :class:`numpy.ndarray` instead of an
+            :class:`array.array`.
+        :rtype: array.array or numpy.ndarray
+        """
+        cast = ArrayCast(typecode, numpy)
+        if default is self.NOTSET or isinstance(default, str):
+            return self.get_value(var, cast=cast, default=default,
+                                  parse_default=True)
+        # Arrays are returned as given, without comparing them to the value.
+        value = self.get_value(var, cast=cast, default=None)
+        return default if value is None else value
+
     def dict(self, var, cast=dict, default=NOTSET):
         """
         :rtype: dict
@@ -299,6 +1490,114 @@ class Env:
 
     db = db_url
 
+    def databases(self, var=DEFAULT_DATABASE_ENV, default=NOTSET, engine=None,
+                  replica_prefix=DEFAULT_REPLICA_PREFIX):
+        """Return a ``DATABASES`` dictionary for all database URLs.
+
+        ``var`` gives the ``default`` database and every ``<var>_<ALIAS>``
+        variable adds a database under the lower-cased alias:
+
+        .. code-block:: shell
+
+            DATABASE_URL=postgres://primary.example.com/app
+            DATABASE_URL_REPLICA1=postgres://replica1.example.com/app
+            DATABASE_URL_ANALYTICS=postgres://warehouse.example.com/dwh
+
+        Aliases starting with ``replica_prefix`` are marked as replicas of
+        ``default`` with ``TEST['MIRROR']``, which Django also uses to run
+        tests against them as the primary. Variables with an empty value are
+        skipped. With :class:`FileAwareEnv`, the URLs can also be read from
+        ``<var>_FILE`` and ``<var>_<ALIAS>_FILE`` files.
+
+        The options in :attr:`DB_SIBLING_OPTIONS` can also be given in
+        variables next to the URL, such as ``DATABASE_URL_REPLICA1_WEIGHT``
+        for the ``weight`` query option of ``DATABASE_URL_REPLICA1``, when
+        that URL is set. They take precedence over the query options.
+
+        The variables are read from a single snapshot of the environment with
+        :meth:`load`, so all invalid URLs are reported together, and parsed
+        through the cache of :meth:`db_url_config`.
+
+        :param str var: Variable of the ``default`` database.
+        :param default: URL used when ``var`` is not set.
+        :param str or None engine: Engine used for all databases.
+        :param str or None replica_prefix: Alias prefix of replicas, or None
+            to mark none.
+        :rtype: dict
+        """
+        def cast(url):
+            return self.db_url_config(url, engine=engine) if url else {}
+
+        names = self.scoped(f'{var}_').keys()
+        if isinstance(type(self).ENVIRON, FileAwareMapping):
+            # <var>_FILE and <var>_<ALIAS>_FILE hold the paths of the URLs,
+            # which are listed under their shortened names as well. The
+            # class is checked, as a snapshot() replaces ENVIRON with a copy.
+            names = [
+                name for name in names
+                if name != 'FILE' and not name.endswith('_FILE')
+            ]
+        # A name ending with an option is a sibling only when the alias it
+        # belongs to is set, e.g. <var>_REPORT_WEIGHT alone is an alias.
+        owners = {}
+        present = set(names)
+        for name in sorted(names, key=len):
+            for option in self.DB_SIBLING_OPTIONS:
+                if name == option:
+                    owners[name] = (var, option)
+                    break
+                base = name[:-len(option) - 1]
+                if (
+                        name.endswith(f'_{option}')
+                        and base in present
+                        and base not in owners
+                ):
+                    owners[name] = (f'{var}_{base}', option)
+                    break
+
+        aliases = {var: self.DEFAULT_DATABASE_ALIAS}
+        siblings = {}
+        for name in names:
+            if name in owners:
+                owner, option = owners[name]
+                siblings.setdefault(owner, {})[option] = f'{var}_{name}'
+            elif name:
+                aliases[f'{var}_{name}'] = name.lower()
+        scheme = {
+            name: (cast, default) if name == var else (cast, '')
+            for name in aliases
+        }
+        for options in siblings.values():
+            scheme.update(dict.fromkeys(options.values(), str))
+        configs = self.load(scheme)
+
+        databases = {}
+        for name, alias in aliases.items():
+            config = configs[name]
+            if isinstance(config, str):
+                # An unparsed default.
+                config = cast(config)
+            if not config:
+                continue
+            parsed = config
+            config = dict(parsed)
+            config['OPTIONS'] = dict(parsed.get('OPTIONS', {}))
+            config['TEST'] = dict(parsed.get('TEST', {}))
+            if (
+                    replica_prefix
+                    and alias != self.DEFAULT_DATABASE_ALIAS
+                    and alias.startswith(replica_prefix.lower())
+            ):
+                config['TEST'].setdefault(
+                    'MIRROR', self.DEFAULT_DATABASE_ALIAS)
+            for option, sibling in siblings.get(name, {}).items():
+                self._set_db_option(config, option.lower(), configs[sibling])
+            for key in ('OPTIONS', 'TEST'):
+                if not config[key] and key not in parsed:
+                    del config[key]
+            databases[alias] = config
+        return databases
+
     def cache_url(self, var=DEFAULT_CACHE_ENV, default=NOTSET, backend=None):
         """Returns a config dictionary, defaulting to CACHE_URL.
 
@@ -343,9 +1642,163 @@ class Env:
         """
         return Path(self.get_value(var, default=default), **kwargs)
 
+    @classmethod
+    def environ_changed(cls):
+        """Invalidate the values and names cached by every :class:`Env`
+        instance.
+
+        Reading env files through :class:`Env` calls this on its own. Call it
+        after changing ``os.environ`` or ``ENVIRON`` directly while
+        ``cache_values`` is enabled or the names of a scope are iterated.
+        """
+        Env._environ_version += 1
+
+    def snapshot(self):
+        """Serve all lookups of this instance from a frozen copy of
+        ``ENVIRON``.
+
+        The copy includes variables layered over the environment with
+        ``read_env(overlay=True)`` and, with :class:`FileAwareEnv`, the
+        content of ``_FILE`` secrets. A secret that cannot be read is left
+        out, and looking it up raises the error of the read. Later changes
+        to the environment are not seen by this instance until
+        :meth:`refresh` is called.
+
+        :rtype: FrozenEnviron
+        """
+        # pylint: disable=invalid-name
+        # pylint: disable=protected-access
+        self.ENVIRON = FrozenEnviron._from_environ(type(self).ENVIRON)
+        return self.ENVIRON
+
+    def refresh(self):
+        """Rebuild the snapshot taken by :meth:`snapshot`.
+
+        :rtype: FrozenEnviron
+        """
+        return self.snapshot()
+
+    def load(self, scheme=None, names=None):
+        """Resolve several variables at once.
+
+        ``scheme`` maps variable names to a cast or a ``(cast, default)``
+        tuple, like the keyword arguments of :class:`Env`. URL parsers such
+        as :meth:`db_url_config` can be used as casts. Each variable is read
+        from ``ENVIRON`` at most once, and every missing or invalid variable
+        is reported in one :class:`ImproperlyConfigured` error, whose
+        ``errors`` attribute maps the names to the original exceptions.
+
+        .. code-block:: python
+
+            settings = env.load({
+                'DEBUG': (bool, False),
+                'ALLOWED_HOSTS': ([str], []),
+                'DATABASE_URL': env.db_url_config,
+            })
+
+        :param dict or None scheme:
+            Variables to resolve, defaults to the variables of the scheme of
+            this instance that start with :attr:`prefix`.
+        :param dict or None names:
+            Variable names for the keys of ``scheme`` that are not variable
+            names themselves, so that one variable can be resolved under
+            several keys with different casts.
+        :returns: The typed values, by key of ``scheme``.
+        :rtype: dict
+        """
+        if scheme is None:
+            start = len(self.prefix)
+            scheme = {
+                name[start:]: info
+                for name, info in self.scheme.items()
+                if name.startswith(self.prefix)
+            }
+
+        env = copy.copy(self)
+        env.cache_values = False
+        if not isinstance(self.ENVIRON, FrozenEnviron):
+            env.ENVIRON = _ReadOnceEnviron(self.ENVIRON)
+
+        values = {}
+        errors = {}
+        for key, var_info in scheme.items():
+            var = names.get(key, key) if names else key
+            entry = _SchemeEntry(var, var_info, self.NOTSET)
+            try:
+                values[key] = env.get_value(
+                    var,
+                    cast=entry.cast,
+                    default=entry.default
+                )
+            except Exception as exc:  # noqa: B902 pylint: disable=broad-except
+                errors[key] = exc
+
+        if errors:
+            raise _invalid_variables_error(errors)
+        return values
+
+    def lazy(self, var, cast=None, default=NOTSET, parse_default=False):
+        """Return a proxy that looks up the variable on first use.
+
+        The value is computed with :meth:`get_value` the first time the
+        proxy is used and cached afterwards. Errors are raised at that time,
+        or all together by :meth:`resolve_all`.
+
+        :rtype: LazyValue
+        """
+        pending = self._lazy_values
+        get_value = functools.partial(
+            self.get_value,
+            var,
+            cast=cast,
+            default=default,
+            parse_default=parse_default
+        )
+
+        def factory():
+            result = get_value()
+            # Only unresolved proxies are kept for resolve_all().
+            pending.pop(key, None)
+            return result
+
+        key = id(factory)
+        value = pending[key] = LazyValue(factory, name=var)
+        return value
+
+    def resolve_all(self):
+        """Resolve every proxy returned by :meth:`lazy` so far.
+
+        Every missing or invalid variable is reported in one
+        :class:`ImproperlyConfigured` error, as in :meth:`load`. Resolved
+        proxies are no longer referenced by this instance.
+        """
+        errors = {}
+        for value in list(self._lazy_values.values()):
+            try:
+                value.resolve()
+            except Exception as exc:  # noqa: B902 pylint: disable=broad-except
+                errors[value._name] = exc  # pylint: disable=protected-access
+        if errors:
+            raise _invalid_variables_error(errors)
+
+    def clear_cache(self):
+        """Drop the values cached by this instance."""
+        self._values_cache = {}
+        self._values_cache_state = (
+            self.ENVIRON, Env._environ_version, _environ_size(self.ENVIRON)
+        )
+
     def get_value(self, var, cast=None, default=NOTSET, parse_default=False):
         """Return value for given environment variable.
 
+        With ``cache_values`` set to ``True``, the result is cached per
+        ``(var, cast, default, parse_default)`` until the environment changes,
+        see :meth:`environ_changed`, variables are added to or removed from
+        ``ENVIRON``, or the scheme changes. Changing ``prefix``,
+        ``smart_cast`` or ``escape_proxy`` requires a call to
+        :meth:`clear_cache`. Changing the value of an existing variable in
+        ``os.environ`` directly also requires :meth:`environ_changed`.
+
         :param str var:
             Name of variable.
         :param collections.abc.Callable or None cast:
@@ -357,32 +1810,44 @@ class Env:
         :returns: Value from environment or default (if set).
         :rtype: typing.IO[typing.Any]
         """
+        if not self.cache_values:
+            return self._get_value(var, cast, default, parse_default)
+
+        environ, version, size = self._values_cache_state
+        if (
+                environ is not self.ENVIRON
+                or version != Env._environ_version
+                or size != _environ_size(environ)
+        ):
+            self.clear_cache()
+        # Drops the cache when the scheme entry of var changed in place.
+        self._scheme_entry(f'{self.prefix}{var}')
 
+        # 1, 1.0 and True are equal keys, so the type of the default is part
+        # of the key.
+        key = (var, cast, type(default), default, parse_default)
+        try:
+            value = self._values_cache.get(key, self.NOTSET)
+        except TypeError:
+            # Unhashable cast or default, such as [int].
+            return self._get_value(var, cast, default, parse_default)
+        if value is self.NOTSET:
+            value = self._get_value(var, cast, default, parse_default)
+            self._values_cache[key] = value
+        return value
+
+    def _get_value(self, var, cast, default, parse_default):
         logger.debug(
             "get '%s' casted as '%s' with default '%s'",
             var, cast, default)
 
         var_name = f'{self.prefix}{var}'
-        if var_name in self.scheme:
-            var_info = self.scheme[var_name]
-
-            try:
-                has_default = len(var_info) == 2
-            except TypeError:
-                has_default = False
-
-            if has_default:
-                if not cast:
-                    cast = var_info[0]
-
-                if default is self.NOTSET:
-                    try:
-                        default = var_info[1]
-                    except IndexError:
-                        pass
-            else:
-                if not cast:
-                    cast = var_info
+        entry = self._scheme_entry(var_name)
+        if entry is not None:
+            if not cast:
+                cast = entry.cast
+            if default is self.NOTSET:
+                default = entry.default
 
         try:
             value = self.ENVIRON[var_name]
@@ -416,10 +1881,47 @@ class Env:
 
         return value
 
+    async def aget_value(self, var, cast=None, default=NOTSET,
+                         parse_default=False):
+        """Asynchronous version of :meth:`get_value`.
+
+        The lookup runs in the default executor of the event loop, so reading
+        ``_FILE`` secrets with :class:`FileAwareEnv` does not block it.
+        Several lookups awaited together with :func:`asyncio.gather` run
+        concurrently.
+        """
+        return await _run_in_executor(
+            self.get_value,
+            var,
+            cast=cast,
+            default=default,
+            parse_default=parse_default
+        )
+
+    async def adb_url(self, var=DEFAULT_DATABASE_ENV, default=NOTSET,
+                      engine=None):
+        """Asynchronous version of :meth:`db_url`.
+
+        :rtype: dict
+        """
+        return await _run_in_executor(
+            self.db_url,
+            var,
+            default=default,
+            engine=engine
+        )
+
+    adb = adb_url
+
     @classmethod
     def parse_value(cls, value, cast):
         """Parse and cast provided value
 
+        The cast is looked up in :attr:`CAST_PARSERS` first, then in the
+        built-in casts (``bool``, ``float``, ``dict``, ``list``, ``tuple`` and
+        their typed forms such as ``[int]``). Any other callable is called
+        with the value.
+
         :param value: Stringed value.
         :param cast: Type to cast return value as.
 
@@ -427,55 +1929,62 @@ class Env:
         """
         if cast is None:
             return value
-        if cast is bool:
-            try:
-                value = int(value) != 0
-            except ValueError:
-                value = value.lower().strip() in cls.BOOLEAN_TRUE_STRINGS
-        elif isinstance(cast, list):
-            value = list(map(cast[0], [x for x in value.split(',') if x]))
-        elif isinstance(cast, tuple):
-            val = value.strip('(').strip(')').split(',')
-            value = tuple(map(cast[0], [x for x in val if x]))
-        elif isinstance(cast, dict):
-            key_cast = cast.get('key', str)
-            value_cast = cast.get('value', str)
-            value_cast_by_key = cast.get('cast', {})
-            value = dict(map(
-                lambda kv: (
-                    key_cast(kv[0]),
-                    cls.parse_value(
-                        kv[1],
-                        value_cast_by_key.get(kv[0], value_cast)
-                    )
-                ),
-                [val.split('=') for val in value.split(';') if val]
-            ))
-        elif cast is dict:
-            value = dict([v.split('=', 1) for v in value.split(',') if v])
-        elif cast is list:
-            value = [x for x in value.split(',') if x]
-        elif cast is tuple:
-            val = value.strip('(').strip(')').split(',')
-            # pylint: disable=consider-using-generator
-            value = tuple([x for x in val if x])
-        elif cast is float:
-            # clean string
-            float_str = re.sub(r'[^\d,.-]', '', value)
-            # split for avoid thousand separator and different
-            # locale comma/dot symbol
-            parts = re.split(r'[,.]', float_str)
-            if len(parts) == 1:
-                float_str = parts[0]
-            else:
-                float_str = f"{''.join(parts[0:-1])}.{parts[-1]}"
-            value = float(float_str)
+        handler = _CAST_INSTANCE_HANDLERS.get(type(cast))
+        if handler is not None:
+            return handler(cls, value, cast)
+        try:
+            parser = cls.CAST_PARSERS.get(cast)
+        except TypeError:  # unhashable cast
+            parser = None
         else:
-            value = cast(value)
-        return value
+            if parser is not None:
+                return parser(value)
+            handler = _CAST_HANDLERS.get(cast)
+            if handler is not None:
+                return handler(cls, value, cast)
+        if not callable(cast):
+            # Subclasses of the typed forms, e.g. a list subclass instance.
+            for kind, handler in _CAST_INSTANCE_HANDLERS.items():
+                if isinstance(cast, kind):
+                    return handler(cls, value, cast)
+        return cast(value)
+
+    @classmethod
+    def register_cast(cls, cast, parser=None):
+        """Register ``parser`` to convert raw values for ``cast``.
+
+        ``parser`` is called with the raw string whenever ``cast`` is used,
+        for example ``env('TIMEOUT', cast=timedelta)``, and takes precedence
+        over the built-in casts. Registered parsers are looked up in
+        :attr:`CAST_PARSERS` with a single dictionary access, so they cost
+        no more than the built-in casts. A parser registered on a subclass
+        only applies to that subclass and its own subclasses. Without
+        ``parser``, returns a decorator:
+
+        .. code-block:: python
+
+            @environ.Env.register_cast(timedelta)
+            def parse_timedelta(value):
+                return timedelta(seconds=float(value))
+
+        :param cast: The hashable cast to register, usually a type.
+        :param parser: Callable taking the raw string.
+        :returns: ``parser``, or a decorator registering its argument.
+        """
+        if parser is None:
+            return functools.partial(cls.register_cast, cast)
+        if 'CAST_PARSERS' not in cls.__dict__:
+            # Copy on write, so that the parsers of the base class are not
+            # changed for its other subclasses.
+            cls.CAST_PARSERS = dict(cls.CAST_PARSERS)
+        cls.CAST_PARSERS[cast] = parser
+        cls.environ_changed()
+        return parser
 
     @classmethod
     # pylint: disable=too-many-statements
+    @_cached_url_config('DB_SCHEMES', 'DB_OPTION_TYPES', 'POSTGRES_FAMILY',
+                        'CLOUDSQL', '_DB_BASE_OPTIONS')
     def db_url_config(cls, url, engine=None):
         # pylint: enable-msg=too-many-statements
         """Parse an arbitrary database URL.
@@ -502,6 +2011,7 @@ class Env:
         :return: Parsed database URL.
         :rtype: dict
         """
+        dsn = None
         if not isinstance(url, cls.URL_CLASS):
             if url == 'sqlite://:memory:':
                 # this is a special case, because if we pass this URL into
@@ -512,40 +2022,39 @@ class Env:
                     'NAME': ':memory:'
                 }
                 # note: no other settings are required for sqlite
-            try:
+            dsn = _parse_dsn(url)
+            if dsn is None:
                 url = urlparse(url)
-            # handle Invalid IPv6 URL
-            except ValueError:
-                url = _urlparse_quote(url)
+        if dsn is None:
+            dsn = _DSN.from_parse_result(url)
 
         config = {}
 
-        # handle unexpected URL schemes with special characters
-        if not url.path:
-            url = _urlparse_quote(urlunparse(url))
         # Remove query strings.
-        path = url.path[1:]
-        path = unquote_plus(path.split('?', 2)[0])
+        path = unquote_plus(dsn.path[1:])
 
-        if url.scheme == 'sqlite':
+        if dsn.scheme == 'sqlite':
             if path == '':
                 # if we are using sqlite and we have no path, then assume we
                 # want an in-memory database (this is the behaviour of
                 # sqlalchemy)
                 path = ':memory:'
-            if url.netloc:
+            if dsn.netloc:
                 warnings.warn(
-                    f'SQLite URL contains host component {url.netloc!r}, '
-                    'it will be ignored',
-                    stacklevel=3
+                    _url_config_warning(
+                        f'SQLite URL contains host component {dsn.netloc!r}, '
+                        'it will be ignored'
+                    ),
+                    # Points at the caller of Env.db() through the cache.
+                    stacklevel=4
                 )
-        if url.scheme == 'ldap':
-            path = f'{url.scheme}://{url.hostname}'
-            if url.port:
-                path += f':{url.port}'
+        if dsn.scheme == 'ldap':
+            path = f'{dsn.scheme}://{dsn.hostname}'
+            if _dsn_port(dsn.port):
+                path += f':{_dsn_port(dsn.port)}'
 
-        user_host = url.netloc.rsplit('@', 1)
-        if url.scheme in cls.POSTGRES_FAMILY and ',' in user_host[-1]:
+        user_host = dsn.netloc.rsplit('@', 1)
+        if dsn.scheme in cls.POSTGRES_FAMILY and ',' in user_host[-1]:
             # Parsing postgres cluster dsn
             hinfo = list(
                 itertools.zip_longest(
@@ -558,59 +2067,70 @@ class Env:
             hostname = ','.join(hinfo[0])
             port = ','.join(filter(None, hinfo[1])) if len(hinfo) == 2 else ''
         else:
-            hostname = url.hostname
-            port = url.port
+            hostname = dsn.hostname
+            port = _dsn_port(dsn.port)
 
         # Update with environment configuration.
         config.update({
             'NAME': path or '',
-            'USER': _cast_urlstr(url.username) or '',
-            'PASSWORD': _cast_urlstr(url.password) or '',
+            'USER': _cast_urlstr(dsn.username) or '',
+            'PASSWORD': _cast_urlstr(dsn.password) or '',
             'HOST': hostname or '',
             'PORT': _cast_int(port) or '',
         })
 
         if (
-                url.scheme in cls.POSTGRES_FAMILY and path.startswith('/')
+                dsn.scheme in cls.POSTGRES_FAMILY and path.startswith('/')
                 or cls.CLOUDSQL in path and path.startswith('/')
         ):
             config['HOST'], config['NAME'] = path.rsplit('/', 1)
 
-        if url.scheme == 'oracle' and path == '':
+        if dsn.scheme == 'oracle' and path == '':
             config['NAME'] = config['HOST']
             config['HOST'] = ''
 
-        if url.scheme == 'oracle':
+        if dsn.scheme == 'oracle':
             # Django oracle/base.py strips port and fails on non-string value
             if not config['PORT']:
                 del config['PORT']
             else:
                 config['PORT'] = str(config['PORT'])
 
-        if url.query:
-            config_options = {}
-            for k, v in parse_qs(url.query).items():
-                if k.upper() in cls._DB_BASE_OPTIONS:
-                    config.update({k.upper(): _cast(v[0])})
-                else:
-                    config_options.update({k: _cast_int(v[0])})
-            config['OPTIONS'] = config_options
+        if dsn.query:
+            config['OPTIONS'] = {}
+            for k, v in parse_qs(dsn.query).items():
+                cls._set_db_option(config, k, v[0])
 
         if engine:
             config['ENGINE'] = engine
         else:
-            config['ENGINE'] = url.scheme
+            config['ENGINE'] = dsn.scheme
 
         if config['ENGINE'] in cls.DB_SCHEMES:
             config['ENGINE'] = cls.DB_SCHEMES[config['ENGINE']]
 
         if not config.get('ENGINE', False):
-            warnings.warn(f'Engine not recognized from url: {config}')
+            warnings.warn(_url_config_warning(
+                f'Engine not recognized from url: {config}'
+            ))
             return {}
 
         return config
 
     @classmethod
+    def _set_db_option(cls, config, name, value):
+        """Store a query option of a database URL in ``config``."""
+        key = name.upper()
+        if key == 'REPLICA_OF':
+            config['TEST'] = {**config.get('TEST', {}), 'MIRROR': value}
+        elif key in cls._DB_BASE_OPTIONS:
+            config[key] = _cast(value, cls.DB_OPTION_TYPES.get(key))
+        else:
+            config.setdefault('OPTIONS', {})[name] = _cast_int(value)
+
+    @classmethod
+    @_cached_url_config('CACHE_SCHEMES', 'CACHE_OPTION_TYPES',
+                        '_CACHE_BASE_OPTIONS')
     def cache_url_config(cls, url, backend=None):
         """Parse an arbitrary cache URL.
 
@@ -671,7 +2191,8 @@ class Env:
         if url.query:
             config_options = {}
             for k, v in parse_qs(url.query).items():
-                opt = {k.upper(): _cast(v[0])}
+                hint = cls.CACHE_OPTION_TYPES.get(k.upper())
+                opt = {k.upper(): _cast(v[0], hint)}
                 if k.upper() in cls._CACHE_BASE_OPTIONS:
                     config.update(opt)
                 else:
@@ -684,6 +2205,7 @@ class Env:
         return config
 
     @classmethod
+    @_cached_url_config('EMAIL_SCHEMES', '_EMAIL_BASE_OPTIONS')
     def email_url_config(cls, url, backend=None):
         """Parse an arbitrary email URL.
 
@@ -803,6 +2325,9 @@ class Env:
         return cfg
 
     @classmethod
+    # The options are cast with parse_value().
+    @_cached_url_config('SEARCH_SCHEMES', 'ELASTICSEARCH_FAMILY',
+                        'BOOLEAN_TRUE_STRINGS', 'CAST_PARSERS')
     def search_url_config(cls, url, engine=None):
         """Parse an arbitrary search URL.
 
@@ -862,8 +2387,40 @@ class Env:
         return config
 
     @classmethod
-    def read_env(cls, env_file=None, overwrite=False, encoding='utf8',
-                 **overrides):
+    def _parse_env_chunks(cls, chunks, env_file):
+        """Yield ``(key, value)`` pairs from chunks of a dotenv file.
+
+        Each chunk may hold any number of complete lines. The size limits
+        are enforced while the chunks are consumed.
+        """
+        max_file_size = cls.READ_ENV_MAX_FILE_SIZE
+        max_line_size = cls.READ_ENV_MAX_LINE_SIZE
+        size = 0
+        lineno = 0
+
+        for chunk in chunks:
+            size += len(chunk)
+            if max_file_size is not None and size > max_file_size:
+                raise _env_file_size_error(env_file, max_file_size)
+            for line in chunk.splitlines():
+                lineno += 1
+                if max_line_size is not None and len(line) > max_line_size:
+                    raise _env_line_size_error(env_file, lineno,
+                                               max_line_size)
+                parsed = _parse_env_line(line)
+                if parsed:
+                    yield parsed
+                elif not line or line.startswith('#'):
+                    # ignore warnings for empty line-breaks or comments
+                    pass
+                else:
+                    logger.warning('Invalid line: %s', line)
+
+    @classmethod
+    # pylint: disable=too-many-arguments
+    def read_env(cls, env_file=None, overwrite=False, encoding='utf8', *,
+                 stream=False, cache=False, overlay=False, **overrides):
+        # pylint: enable-msg=too-many-arguments
         r"""Read a .env file into os.environ.
 
         If not given a path to a dotenv path, does filthy magic stack
@@ -874,6 +2431,10 @@ class Env:
         by the file content. ``overwrite=True`` will force an overwrite of
         existing environment variables.
 
+        Files and lines longer than :attr:`READ_ENV_MAX_FILE_SIZE` and
+        :attr:`READ_ENV_MAX_LINE_SIZE` characters are rejected with
+        :class:`ImproperlyConfigured` when those limits are set.
+
         Refs:
 
         * https://wellfire.co/learn/easier-12-factor-django
@@ -884,72 +2445,42 @@ class Env:
         :param overwrite: ``overwrite=True`` will force an overwrite of
             existing environment variables.
         :param encoding: The encoding to use when reading the environment file.
+        :param stream: ``stream=True`` applies each variable as soon as its
+            line is parsed instead of reading the whole file first, so memory
+            use does not grow with the file size. In this mode ``env_file``
+            may also be any iterable of lines, such as a generator or a pipe.
+            Variables parsed before a read error stay applied.
+        :param cache: ``cache=True`` stores the parsed variables in a
+            ``<env_file>.cache`` sidecar file and reuses them as long as the
+            path, modification time, size and content hash of ``env_file``
+            are unchanged. A path may be given to use another sidecar file.
+            Only used when ``env_file`` is a path and ``stream`` is not set.
+        :param overlay: ``overlay=True`` keeps the variables in an in-memory
+            layer over ``ENVIRON`` instead of writing them into the process
+            environment. See :meth:`overlay_environ`.
         :param \**overrides: Any additional keyword arguments provided directly
             to read_env will be added to the environment. If the key matches an
             existing environment variable, the value will be overridden.
         """
         if env_file is None:
-            # pylint: disable=protected-access
-            frame = sys._getframe()
-            env_file = os.path.join(
-                os.path.dirname(frame.f_back.f_code.co_filename),
-                '.env'
-            )
-            if not os.path.exists(env_file):
-                logger.info(
-                    "%s doesn't exist - if you're not configuring your "
-                    "environment separately, create one.", env_file)
+            env_file = _default_env_file(2)
+            if env_file is None:
                 return
 
         try:
-            if isinstance(env_file, Openable):
-                # Python 3.5 support (wrap path with str).
-                with open(str(env_file), encoding=encoding) as f:
-                    content = f.read()
+            if stream:
+                cls._stream_env(env_file, encoding, overwrite, overrides,
+                                overlay)
             else:
-                with env_file as f:
-                    content = f.read()
+                overrides.update(
+                    cls._read_env_values(env_file, encoding, cache)
+                )
         except OSError:
             logger.info(
                 "%s not found - if you're not configuring your "
                 "environment separately, check this.", env_file)
             return
 
-        logger.debug('Read environment variables from: %s', env_file)
-
-        def _keep_escaped_format_characters(match):
-            """Keep escaped newline/tabs in quoted strings"""
-            escaped_char = match.group(1)
-            if escaped_char in 'rnt':
-                return '\\' + escaped_char
-            return escaped_char
-
-        for line in content.splitlines():
-            m1 = re.match(r'\A(?:export )?([A-Za-z_0-9]+)=(.*)\Z', line)
-            if m1:
-                key, val = m1.group(1), m1.group(2)
-                # Look for value in quotes, ignore post-# comments
-                # (outside quotes)
-                m2 = re.match(r"\A\s*'(?<!\\)(.*)'\s*(#.*\s*)?\Z", val)
-                if m2:
-                    val = m2.group(1)
-                else:
-                    # For no quotes, find value, ignore comments
-                    # after the first #
-                    m2a = re.match(r"\A(.*?)(#.*\s*)?\Z", val)
-                    if m2a:
-                        val = m2a.group(1)
-                m3 = re.match(r'\A"(.*)"\Z', val)
-                if m3:
-                    val = re.sub(r'\\(.)', _keep_escaped_format_characters,
-                                 m3.group(1))
-                overrides[key] = str(val)
-            elif not line or line.startswith('#'):
-                # ignore warnings for empty line-breaks or comments
-                pass
-            else:
-                logger.warning('Invalid line: %s', line)
-
         def set_environ(envval):
             """Return lambda to set environ.
 
@@ -959,10 +2490,278 @@ class Env:
                 return lambda k, v: envval.update({k: str(v)})
             return lambda k, v: envval.setdefault(k, str(v))
 
-        setenv = set_environ(cls.ENVIRON)
+        setenv = set_environ(
+            cls.overlay_environ() if overlay else cls.ENVIRON
+        )
 
         for key, value in overrides.items():
             setenv(key, value)
+        cls.environ_changed()
+
+    @classmethod
+    def aread_env(cls, env_file=None, **kwargs):
+        r"""Asynchronous version of :meth:`read_env`.
+
+        The file is read and parsed in the default executor of the event
+        loop, so it can be awaited during ASGI lifespan startup. The default
+        ``env_file`` is resolved when this method is called, before the
+        returned awaitable runs in the event loop.
+
+        :param env_file: The path to the ``.env`` file, defaults to the
+            ``.env`` file next to the calling module.
+        :param \**kwargs: Passed on to :meth:`read_env`.
+        :returns: An awaitable.
+        """
+        if env_file is None:
+            env_file = _default_env_file(2)
+        return cls._aread_env(env_file, kwargs)
+
+    @classmethod
+    async def _aread_env(cls, env_file, kwargs):
+        if env_file is not None:
+            await _run_in_executor(cls.read_env, env_file, **kwargs)
+
+    @classmethod
+    # pylint: disable=too-many-arguments
+    def read_env_files(cls, env_files, overwrite=False, encoding='utf8', *,
+                       cache=False, parallel=False, overlay=False):
+        # pylint: enable-msg=too-many-arguments
+        """Read several .env files into os.environ in one go.
+
+        ``env_files`` is an ordered sequence of paths. A directory stands for
+        the ``*.env`` files it contains, in alphabetical order, so fragments
+        can be kept in a ``.env.d`` directory. Files that do not exist are
+        skipped.
+
+        All files are parsed before anything is written, and variables from
+        later files take precedence over earlier ones. The merged result is
+        then applied to the environment with a single update.
+
+        .. code-block:: python
+
+            env.read_env_files([
+                BASE_DIR('.env'),
+                BASE_DIR('.env.d'),
+                BASE_DIR(f'.env.{STAGE}'),
+                BASE_DIR('.env.local'),
+            ])
+
+        :param env_files: Paths of the files and directories to read.
+        :param overwrite: ``overwrite=True`` will force an overwrite of
+            existing environment variables.
+        :param encoding: The encoding to use when reading the files.
+        :param cache: Whether to use a sidecar cache for each file, as in
+            :meth:`read_env`.
+        :param parallel: ``parallel=True`` parses the files in a thread pool.
+        :param overlay: Whether to keep the variables in an in-memory layer
+            over ``ENVIRON``, as in :meth:`read_env`.
+        :returns: The merged variables read from the files.
+        :rtype: dict
+        """
+        paths = []
+        for env_file in env_files:
+            if isinstance(env_file, Openable) and os.path.isdir(env_file):
+                paths.extend(sorted(
+                    glob.glob(os.path.join(str(env_file), '*.env'))
+                ))
+            else:
+                paths.append(env_file)
+
+        def read(env_file):
+            try:
+                return cls._read_env_values(env_file, encoding, cache)
+            except OSError:
+                logger.info(
+                    "%s not found - if you're not configuring your "
+                    "environment separately, check this.", env_file)
+                return {}
+
+        if parallel and len(paths) > 1:
+            with ThreadPoolExecutor() as executor:
+                layers = list(executor.map(read, paths))
+        else:
+            layers = [read(path) for path in paths]
+
+        merged = {}
+        for layer in layers:
+            merged.update(layer)
+
+        environ = cls.overlay_environ() if overlay else cls.ENVIRON
+        if overwrite:
+            environ.update(merged)
+        else:
+            environ.update({
+                key: value for key, value in merged.items()
+                if key not in environ
+            })
+        cls.environ_changed()
+        return merged
+
+    @classmethod
+    def _environ_overlay(cls):
+        environ = cls.ENVIRON
+        if isinstance(environ, FileAwareMapping):
+            environ = environ.env
+        return environ if isinstance(environ, _EnvironOverlay) else None
+
+    @classmethod
+    def overlay_environ(cls):
+        """Layer an in-memory mapping over ``ENVIRON`` and return it.
+
+        ``ENVIRON`` of this class is replaced by a mapping whose in-memory
+        layer receives every write, while lookups fall through to the
+        previous ``ENVIRON``. Deleted keys
+        are hidden rather than removed from the mapping below. Values read
+        with ``overlay=True`` are therefore visible to :meth:`get_value`
+        without touching ``os.environ`` or the environment of child
+        processes. With a :class:`FileAwareMapping`, the layer is placed
+        under it, so ``_FILE`` variables of the layer are read as well.
+
+        Calling it again reuses the existing layer until
+        :meth:`remove_overlay` restores the previous ``ENVIRON``.
+
+        :rtype: collections.abc.MutableMapping
+        """
+        if cls._environ_overlay() is None:
+            environ = cls.ENVIRON
+            previous = cls.__dict__.get('ENVIRON', cls.NOTSET)
+            if isinstance(environ, FileAwareMapping):
+                cls.ENVIRON = FileAwareMapping(
+                    _EnvironOverlay(environ.env, previous),
+                    cache=environ.cache,
+                )
+            else:
+                cls.ENVIRON = _EnvironOverlay(environ, previous)
+            cls.environ_changed()
+        return cls.ENVIRON
+
+    @classmethod
+    def remove_overlay(cls):
+        """Remove the layer added by :meth:`overlay_environ`.
+
+        ``ENVIRON`` is restored to what it was before the layer was added.
+
+        :returns: The variables that were set in the layer.
+        :rtype: dict
+        """
+        overlay = cls._environ_overlay()
+        if overlay is None:
+            return {}
+        owner = next(
+            klass for klass in cls.__mro__ if 'ENVIRON' in klass.__dict__
+        )
+        if overlay.previous is cls.NOTSET:
+            del owner.ENVIRON
+        else:
+            owner.ENVIRON = overlay.previous
+        cls.environ_changed()
+        return dict(overlay.layer)
+
+    @classmethod
+    def _read_env_values(cls, env_file, encoding, cache=False):
+        """Return the variables parsed from ``env_file`` as a dict."""
+        if cache and isinstance(env_file, Openable):
+            return cls._read_env_cached(env_file, encoding, cache)
+        content = _read_env_content(env_file, encoding,
+                                    cls.READ_ENV_MAX_FILE_SIZE)
+        return dict(cls._parse_env_chunks([content], env_file))
+
+    @classmethod
+    def _read_env_cached(cls, env_file, encoding, cache_file):
+        """Return the variables of ``env_file``, using a sidecar cache.
+
+        The cache holds the parsed variables together with the path,
+        modification time, size and content hash of ``env_file``. It is
+        rebuilt whenever any of them change, or when it holds anything but
+        string keys and values. The size limits are checked on every read,
+        and the cache file gets the permissions of ``env_file``.
+        """
+        env_file = os.path.abspath(str(env_file))
+        if not isinstance(cache_file, Openable):
+            cache_file = env_file + '.cache'
+        cache_file = str(cache_file)
+
+        with open(env_file, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+        key = {
+            'path': env_file,
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'hash': hashlib.sha256(data).hexdigest(),
+            'encoding': encoding,
+        }
+        content = data.decode(encoding)
+
+        max_file_size = cls.READ_ENV_MAX_FILE_SIZE
+        if max_file_size is not None and len(content) > max_file_size:
+            raise _env_file_size_error(env_file, max_file_size)
+        max_line_size = cls.READ_ENV_MAX_LINE_SIZE
+        if max_line_size is not None:
+            for lineno, line in enumerate(content.splitlines(), 1):
+                if len(line) > max_line_size:
+                    raise _env_line_size_error(env_file, lineno,
+                                               max_line_size)
+
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                cached = json.load(f)
+            values = cached['values']
+            if cached['key'] == key and all(
+                    isinstance(name, str) and isinstance(value, str)
+                    for name, value in values.items()
+            ):
+                logger.debug('Read cached environment variables from: %s',
+                             cache_file)
+                return values
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            pass
+
+        values = dict(cls._parse_env_chunks([content], env_file))
+        logger.debug('Read environment variables from: %s', env_file)
+
+        temp_file = None
+        try:
+            fd, temp_file = tempfile.mkstemp(
+                prefix=f'{os.path.basename(cache_file)}.', suffix='.tmp',
+                dir=os.path.dirname(os.path.abspath(cache_file)),
+            )
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                os.chmod(temp_file, stat.st_mode & 0o777)
+                json.dump({'key': key, 'values': values}, f,
+                          separators=(',', ':'))
+            os.replace(temp_file, cache_file)
+        except OSError:
+            logger.warning('Unable to write env cache file: %s', cache_file)
+            if temp_file is not None and os.path.exists(temp_file):
+                os.remove(temp_file)
+        return values
+
+    @classmethod
+    def _stream_env(cls, env_file, encoding, overwrite, overrides,
+                    overlay=False):
+        """Apply the variables of ``env_file`` line by line.
+
+        Values from the file take precedence over matching ``overrides``,
+        which are removed from the mapping as they are superseded. A key
+        repeated in the file is overwritten by its last value, as it is when
+        the whole file is read at once.
+        """
+        environ = cls.overlay_environ() if overlay else cls.ENVIRON
+        written = set()
+        chunks = _iter_env_chunks(env_file, encoding)
+        logger.debug('Stream environment variables from: %s', env_file)
+
+        try:
+            for key, value in cls._parse_env_chunks(chunks, env_file):
+                overrides.pop(key, None)
+                if overwrite or key in written:
+                    environ[key] = value
+                elif key not in environ:
+                    environ[key] = value
+                    written.add(key)
+        finally:
+            cls.environ_changed()
 
 
 class FileAwareEnv(Env):
@@ -8,10 +8,16 @@
 
 """Docker-style file variable support module."""
 
+import asyncio
 import os
 from collections.abc import MutableMapping
 
 
+def _read_file(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
 class FileAwareMapping(MutableMapping):
     """
     A mapping that wraps os.environ, first checking for the existence of a key
@@ -45,13 +51,50 @@ class FileAwareMapping(MutableMapping):
             return self.files_cache[key]
         key_file = self.env.get(key + "_FILE")
         if key_file:
-            with open(key_file, encoding='utf-8') as f:
-                value = f.read()
+            value = _read_file(key_file)
             if self.cache:
                 self.files_cache[key] = value
             return value
         return self.env[key]
 
+    def __contains__(self, key):
+        # Checked without reading the file, unlike a lookup.
+        return bool(self.env.get(key + "_FILE")) or key in self.env
+
+    async def aprefetch(self, keys=None):
+        """
+        Read the files of several ``_FILE`` keys concurrently.
+
+        The files are read in the default executor of the running event loop
+        and stored in the cache, so later lookups of these keys do not touch
+        the file system.
+
+        :param keys:
+            the keys to read, without the ``_FILE`` suffix (defaults to every
+            key that has a ``_FILE`` variable)
+        :returns: a dict of the keys backed by a file and their contents
+        """
+        if keys is None:
+            keys = [key[:-5] for key in self.env
+                    if key.endswith("_FILE") and key[:-5]]
+        files = {}
+        for key in keys:
+            key_file = self.env.get(key + "_FILE")
+            if key_file and not (self.cache and key in self.files_cache):
+                files[key] = key_file
+
+        loop = asyncio.get_event_loop()
+        contents = await asyncio.gather(*(
+            loop.run_in_executor(None, _read_file, key_file)
+            for key_file in files.values()
+        ))
+        values = dict(zip(files, contents))
+        if self.cache:
+            self.files_cache.update(values)
+            values = {key: self.files_cache[key] for key in keys
+                      if key in self.files_cache}
+        return values
+
     def __iter__(self):
         """
         Iterate all keys, also always including the shortened key if ``_FILE``
@@ -0,0 +1,131 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+"""Lazily evaluated environment values."""
+
+import operator
+import os
+
+_UNRESOLVED = object()
+
+
+def _identity(value):
+    return value
+
+
+def _unary(func):
+    def method(self):
+        return func(self._resolve())  # pylint: disable=protected-access
+    return method
+
+
+def _binary(func):
+    def method(self, other):
+        return func(self._resolve(), other)  # pylint: disable=protected-access
+    return method
+
+
+def _reflected(func):
+    def method(self, other):
+        return func(other, self._resolve())  # pylint: disable=protected-access
+    return method
+
+
+class LazyValue:
+    """
+    A proxy for a value that is computed on first use and then cached.
+
+    Attribute access, comparisons, arithmetic, iteration, conversions such as
+    ``str()`` or ``bool()`` and :func:`isinstance` checks are forwarded to
+    the resolved value. Code that needs the real object, for example to
+    check ``type(value)``, can call :meth:`resolve`.
+    """
+
+    __slots__ = ('_factory', '_value', '_name')
+
+    def __init__(self, factory, name=None):
+        """
+        Initialize the proxy.
+
+        :param factory:
+            callable without arguments returning the value
+        :param name:
+            name shown by ``repr()`` while the value is not resolved
+        """
+        self._factory = factory
+        self._value = _UNRESOLVED
+        self._name = name
+
+    def _resolve(self):
+        if self._value is _UNRESOLVED:
+            self._value = self._factory()
+        return self._value
+
+    def resolve(self):
+        """Return the value, computing it if needed."""
+        return self._resolve()
+
+    @property
+    def resolved(self):
+        """Whether the value has already been computed."""
+        return self._value is not _UNRESOLVED
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __repr__(self):
+        if self._value is _UNRESOLVED:
+            return f'<{type(self).__name__}: {self._name!r}>'
+        return repr(self._value)
+
+    def __reduce__(self):
+        return _identity, (self._resolve(),)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    __class__ = property(_unary(operator.attrgetter('__class__')))
+
+    __str__ = _unary(str)
+    __bytes__ = _unary(bytes)
+    __bool__ = _unary(bool)
+    __int__ = _unary(int)
+    __float__ = _unary(float)
+    __index__ = _unary(operator.index)
+    __hash__ = _unary(hash)
+    __len__ = _unary(len)
+    __iter__ = _unary(iter)
+    __fspath__ = _unary(os.fspath)
+    __format__ = _binary(format)
+
+    __eq__ = _binary(operator.eq)
+    __ne__ = _binary(operator.ne)
+    __lt__ = _binary(operator.lt)
+    __le__ = _binary(operator.le)
+    __gt__ = _binary(operator.gt)
+    __ge__ = _binary(operator.ge)
+
+    __getitem__ = _binary(operator.getitem)
+    __contains__ = _binary(operator.contains)
+
+    __add__ = _binary(operator.add)
+    __radd__ = _reflected(operator.add)
+    __sub__ = _binary(operator.sub)
+    __rsub__ = _reflected(operator.sub)
+    __mul__ = _binary(operator.mul)
+    __rmul__ = _reflected(operator.mul)
+    __truediv__ = _binary(operator.truediv)
+    __rtruediv__ = _reflected(operator.truediv)
+    __floordiv__ = _binary(operator.floordiv)
+    __rfloordiv__ = _reflected(operator.floordiv)
+    __mod__ = _binary(operator.mod)
+    __rmod__ = _reflected(operator.mod)
+    __or__ = _binary(operator.or_)
+    __ror__ = _reflected(operator.or_)
+    __and__ = _binary(operator.and_)
+    __rand__ = _reflected(operator.and_)
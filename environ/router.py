@@ -0,0 +1,170 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+"""Database router spreading reads across replicas."""
+
+import functools
+import itertools
+import math
+import threading
+import time
+
+from .compat import ImproperlyConfigured
+
+try:
+    import contextvars
+except ImportError:  # Python 3.6
+    contextvars = None
+
+
+class _ThreadPin(threading.local):
+    """A per-thread stand-in for :class:`contextvars.ContextVar`."""
+
+    value = 0.0
+
+    def get(self):
+        """Return the value of the current thread."""
+        return self.value
+
+    def set(self, value):
+        """Set the value of the current thread."""
+        self.value = value
+
+
+# Monotonic time until which reads of the current context go to the primary.
+if contextvars is not None:
+    _pinned_until = contextvars.ContextVar('environ_replica_pin', default=0.0)
+else:
+    _pinned_until = _ThreadPin()
+
+
+def _weighted_order(weights):
+    """Return one cycle of smooth weighted round-robin over ``weights``.
+
+    Each alias appears as many times as its weight, spread as evenly as
+    possible, e.g. ``a, b, a`` rather than ``a, a, b`` for weights 2 and 1.
+    """
+    divisor = functools.reduce(math.gcd, weights.values())
+    weights = {alias: weight // divisor for alias, weight in weights.items()}
+    total = sum(weights.values())
+    current = dict.fromkeys(weights, 0)
+    order = []
+    for _ in range(total):
+        for alias, weight in weights.items():
+            current[alias] += weight
+        alias = max(current, key=current.get)
+        current[alias] -= total
+        order.append(alias)
+    return order
+
+
+class ReplicaRouter:
+    """
+    A Django database router sending reads to the replicas of the primary.
+
+    Replicas are the databases whose ``TEST['MIRROR']`` is the primary, as
+    set by :meth:`.Env.databases`. Reads are spread across them with
+    weighted round-robin, using the ``WEIGHT`` of each replica (1 when not
+    set, 0 leaves a replica out). Writes go to the primary and pin the reads
+    of the current thread or task to it for ``pin_seconds``, so that they
+    see their own writes despite the replication lag:
+
+    .. code-block:: python
+
+        DATABASES = env.databases()
+        DATABASE_ROUTERS = ['environ.ReplicaRouter']
+
+    Call :meth:`unpin` at the end of a request, for example from the
+    ``request_finished`` signal, to end the pin early.
+    """
+
+    primary = 'default'
+    pin_seconds = 1.0
+
+    def __init__(self, databases=None):
+        """
+        Initialize the router.
+
+        :param databases:
+            the ``DATABASES`` mapping, defaults to the Django setting
+        """
+        if databases is None:
+            # pylint: disable=import-outside-toplevel
+            from django.conf import settings
+            databases = settings.DATABASES
+
+        weights = {}
+        for alias, config in databases.items():
+            if config.get('TEST', {}).get('MIRROR') != self.primary:
+                continue
+            try:
+                weight = int(config.get('WEIGHT', 1))
+            except (TypeError, ValueError):
+                weight = -1
+            if weight < 0:
+                raise ImproperlyConfigured(
+                    f'Invalid WEIGHT of database {alias!r}: '
+                    f'{config["WEIGHT"]!r}'
+                )
+            weights[alias] = weight
+
+        self.replicas = frozenset(weights)
+        weights = {alias: weight for alias, weight in weights.items()
+                   if weight}
+        if weights:
+            self._next_replica = itertools.cycle(
+                _weighted_order(weights)).__next__
+        else:
+            self._next_replica = None
+
+    @classmethod
+    def pin(cls, seconds=None):
+        """Send the reads of the current context to the primary.
+
+        :param seconds: How long, defaults to ``pin_seconds``.
+        """
+        seconds = cls.pin_seconds if seconds is None else seconds
+        _pinned_until.set(time.monotonic() + seconds)
+
+    @staticmethod
+    def unpin():
+        """Let the reads of the current context go to replicas again."""
+        _pinned_until.set(0.0)
+
+    @staticmethod
+    def is_pinned():
+        """Whether the reads of the current context go to the primary."""
+        return time.monotonic() < _pinned_until.get()
+
+    # The arguments of the router methods are fixed by Django.
+    # pylint: disable=unused-argument
+
+    def db_for_read(self, model, **hints):
+        """Return the next replica, or the primary while pinned."""
+        if self._next_replica is None or self.is_pinned():
+            return self.primary
+        return self._next_replica()
+
+    def db_for_write(self, model, **hints):
+        """Return the primary and pin the reads of the current context."""
+        self.pin()
+        return self.primary
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Allow relations between the primary and its replicas."""
+        group = self.replicas | {self.primary}
+        # pylint: disable=protected-access
+        if obj1._state.db in group and obj2._state.db in group:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """Leave replicas out of migrations."""
+        if db in self.replicas:
+            return False
+        return None
@@ -0,0 +1,133 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+"""Declarative settings classes backed by environment variables."""
+
+from .environ import Env
+
+
+class Var:
+    """Declare a field of a :class:`Settings` class.
+
+    :param cast: Type to cast the value as, as in :meth:`Env.get_value`.
+    :param default: Value used when the variable is not set.
+    :param str or None var: Name of the environment variable, defaults to
+        the upper-cased field name.
+    """
+
+    __slots__ = ('cast', 'default', 'var', 'name')
+
+    def __init__(self, cast=None, default=Env.NOTSET, var=None):
+        self.cast = cast
+        self.default = default
+        self.var = var
+        self.name = None
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.var!r}, cast={self.cast!r})'
+
+
+class SettingsMeta(type):
+    """Turn the :class:`Var` attributes of a class into ``__slots__``."""
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        fields = {}
+        for base in reversed(bases):
+            fields.update(getattr(base, '_fields', {}))
+
+        own = {
+            key: value for key, value in namespace.items()
+            if isinstance(value, Var)
+        }
+        for key, field in own.items():
+            del namespace[key]
+            field.name = key
+            if field.var is None:
+                field.var = key.upper()
+        fields.update(own)
+
+        namespace['__slots__'] = tuple(namespace.get('__slots__', ()))
+        namespace['__slots__'] += tuple(own)
+        namespace['_fields'] = fields
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class Settings(metaclass=SettingsMeta):
+    """
+    A typed settings object populated from environment variables.
+
+    Fields are declared with :class:`Var` and stored in ``__slots__``, so
+    reading a setting is a plain attribute access and instances carry no
+    ``__dict__``:
+
+    .. code-block:: python
+
+        class AppSettings(environ.Settings):
+            debug = environ.Var(bool, default=False)
+            allowed_hosts = environ.Var([str], default=[])
+            database = environ.Var(environ.Env.db_url_config,
+                                   var='DATABASE_URL')
+
+        settings = AppSettings()
+        settings.debug
+
+    By default every field is resolved when the instance is created, in a
+    single pass with :meth:`Env.load`, so that all missing or invalid
+    variables are reported at once. With ``lazy=True`` each field is
+    resolved on first access and then stored.
+    """
+
+    __slots__ = ('_env',)
+
+    def __init__(self, env=None, lazy=False):
+        """
+        Initialize the settings.
+
+        :param env:
+            the :class:`Env` used to read variables (defaults to a new
+            :class:`Env`)
+        :param lazy:
+            resolve fields on first access instead of right away
+        """
+        self._env = env if env is not None else Env()
+        if lazy:
+            return
+
+        values = self._env.load(
+            {
+                name: (field.cast, field.default)
+                for name, field in self._fields.items()
+            },
+            names={name: field.var for name, field in self._fields.items()},
+        )
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __getattr__(self, name):
+        # Only called for fields not resolved yet.
+        try:
+            field = self._fields[name]
+        except KeyError:
+            raise AttributeError(
+                f'{self.__class__.__name__!r} object has no attribute '
+                f'{name!r}'
+            ) from None
+        value = self._env.get_value(field.var, cast=field.cast,
+                                    default=field.default)
+        setattr(self, name, value)
+        return value
+
+    def __repr__(self):
+        values = ', '.join(
+            f'{name}={getattr(self, name)!r}' for name in self._fields
+        )
+        return f'{self.__class__.__name__}({values})'
+
+    def as_dict(self):
+        """Return all settings in a dict, resolving any pending field."""
+        return {name: getattr(self, name) for name in self._fields}
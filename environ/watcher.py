@@ -0,0 +1,178 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+"""Hot reload support for .env files."""
+
+import logging
+import os
+import threading
+
+from .environ import Env
+
+logger = logging.getLogger(__name__)
+
+
+class EnvWatcher:
+    """
+    Keep the environment in sync with a ``.env`` file while the process runs.
+
+    The file is read once when the watcher is created. Afterwards
+    :meth:`check` compares the file's modification time, size and inode with
+    the previous ones, which costs a single :func:`os.stat` call, and only
+    parses the file again when they differ. Changed, added and removed
+    variables are then applied to ``env.ENVIRON`` and passed to the
+    registered callbacks.
+
+    :meth:`start` runs :meth:`check` every ``interval`` seconds on a daemon
+    thread:
+
+    .. code-block:: python
+
+        watcher = environ.EnvWatcher(BASE_DIR('.env'), interval=5)
+        watcher.add_callback(lambda keys: logger.info('Reloaded %s', keys))
+        watcher.start()
+    """
+
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+    def __init__(self, env_file, *, env=Env, interval=1.0, overwrite=False,
+                 encoding='utf8', overlay=False):
+        """
+        Initialize the watcher and read ``env_file``.
+
+        :param env_file:
+            path of the ``.env`` file to watch
+        :param env:
+            the :class:`~environ.Env` class or instance whose ``ENVIRON``
+            receives the variables (defaults to :class:`~environ.Env`)
+        :param interval:
+            seconds between two checks of the background thread
+        :param overwrite:
+            whether variables already present in the environment are
+            overwritten, as in :meth:`~environ.Env.read_env`. Variables set
+            by the watcher itself are always updated.
+        :param encoding:
+            the encoding of ``env_file``
+        :param overlay:
+            whether to keep the variables in an in-memory layer over
+            ``ENVIRON``, as in :meth:`~environ.Env.read_env`
+        """
+        self.env_file = str(env_file)
+        self.env = env
+        self.interval = interval
+        self.overwrite = overwrite
+        self.encoding = encoding
+        self.overlay = overlay
+        self.callbacks = []
+        self.values = {}
+        self._owned = set()
+        self._signature = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self.check()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def add_callback(self, callback):
+        """Call ``callback`` with the set of changed keys after a reload."""
+        self.callbacks.append(callback)
+        return callback
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.env_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def check(self):
+        """Reload the file if it has changed since the last check.
+
+        A file that has disappeared keeps its variables in place until it
+        comes back, so that editors replacing the file do not cause a gap.
+
+        :returns: The keys that were changed, added or removed.
+        :rtype: set
+        """
+        with self._lock:
+            signature = self._stat()
+            if signature is None or signature == self._signature:
+                return set()
+
+            try:
+                # pylint: disable=protected-access
+                values = self.env._read_env_values(self.env_file,
+                                                   self.encoding)
+            except OSError:
+                return set()
+            self._signature = signature
+
+            changed = {
+                key for key in self.values.keys() | values.keys()
+                if self.values.get(key) != values.get(key)
+            }
+            self._apply(values, changed)
+            self.values = values
+
+        if changed:
+            logger.debug('Reloaded %s, changed: %s', self.env_file,
+                         ', '.join(sorted(changed)))
+            for callback in self.callbacks:
+                try:
+                    callback(changed)
+                except Exception:  # noqa: B902 pylint: disable=broad-except
+                    logger.exception('Env reload callback %r failed',
+                                     callback)
+        return changed
+
+    def _apply(self, values, changed):
+        if self.overlay:
+            environ = self.env.overlay_environ()
+        else:
+            environ = self.env.ENVIRON
+
+        for key in changed:
+            if key not in values:
+                if key in self._owned:
+                    self._owned.discard(key)
+                    environ.pop(key, None)
+            elif self.overwrite or key in self._owned or key not in environ:
+                environ[key] = values[key]
+                self._owned.add(key)
+        self.env.environ_changed()
+
+    def start(self):
+        """Start checking the file on a background daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f'EnvWatcher({self.env_file})',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stop the background thread and wait for it to finish."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.check()
+            except Exception:  # noqa: B902 pylint: disable=broad-except
+                logger.exception('Failed to reload %s', self.env_file)
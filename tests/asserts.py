@@ -6,6 +6,72 @@
 # For the full copyright and license information, please view
 # the LICENSE.txt file that was distributed with this source code.
 
+import sys
+import timeit
+
+
 def assert_type_and_value(type_, expected, actual):
     assert isinstance(actual, type_)
     assert actual == expected
+
+
+def count_steps(func, *args):
+    """Return the number of Python lines executed by ``func(*args)``."""
+    steps = 0
+
+    def trace(frame, event, arg):
+        nonlocal steps
+        if event == 'line':
+            steps += 1
+        return trace
+
+    previous = sys.gettrace()
+    sys.settrace(trace)
+    try:
+        func(*args)
+    finally:
+        sys.settrace(previous)
+    return steps
+
+
+def assert_linear(func, make_input, size=2000, factor=8, attempts=3):
+    """Check that ``func`` runs in linear time on ``make_input(size)``.
+
+    Growing the input ``factor`` times must not cost more than twice
+    ``factor`` as many executed lines, while a quadratic cost would grow
+    ``factor`` squared times. Lines do not show the work done in C, such as
+    a backtracking regular expression, so the time is compared as well:
+    one call on the large input must not take more than three times as
+    long as ``factor`` calls on the small one. The timing is tried
+    ``attempts`` times to ride out a busy machine.
+    """
+    small_input = make_input(size)
+    large_input = make_input(size * factor)
+    small = count_steps(func, small_input)
+    large = count_steps(func, large_input)
+    assert large <= small * factor * 2
+
+    for _ in range(attempts):
+        small = min(timeit.repeat(lambda: func(small_input),
+                                  number=factor, repeat=3))
+        large = min(timeit.repeat(lambda: func(large_input),
+                                  number=1, repeat=3))
+        if large <= small * 3:
+            return
+    raise AssertionError(
+        f'{large:.6f}s for an input {factor} times larger, against '
+        f'{small:.6f}s for {factor} calls on the smaller one'
+    )
+
+
+def assert_fast(func, seconds, attempts=3):
+    """Check that ``func()`` returns within ``seconds``.
+
+    The ceiling is meant to be coarse, catching a blow-up rather than a
+    slowdown, and is tried ``attempts`` times to ride out a busy machine.
+    """
+    for _ in range(attempts):
+        elapsed = min(timeit.repeat(func, number=1, repeat=1))
+        if elapsed <= seconds:
+            return
+    raise AssertionError(f'took {elapsed:.3f}s, more than {seconds}s')
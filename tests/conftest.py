@@ -12,6 +12,16 @@ import sys
 
 import pytest
 
+from environ import Env
+
+
+@pytest.fixture(autouse=True)
+def url_config_cache():
+    """Start every test with an empty cache of parsed URL configs."""
+    Env.url_config_cache.clear()
+    yield Env.url_config_cache
+    Env.url_config_cache.clear()
+
 
 @pytest.fixture
 def solr_url():
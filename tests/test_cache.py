@@ -170,6 +170,20 @@ def test_options_parsing():
     }
 
 
+def test_options_type_hints():
+    url = ('rediscache://127.0.0.1:6379/1?key_prefix=1&version=2&'
+           'binary=true&max_entries=None&hosts=[1,2]')
+    url = Env.cache_url_config(url)
+
+    assert url['KEY_PREFIX'] == '1'
+    assert url['VERSION'] == 2
+    assert url['BINARY'] is True
+    assert url['OPTIONS'] == {
+        'MAX_ENTRIES': None,
+        'HOSTS': '[1,2]',
+    }
+
+
 def test_custom_backend():
     url = 'memcache://127.0.0.1:5400?foo=option&bars=9001'
     backend = 'django_redis.cache.RedisCache'
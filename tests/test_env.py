@@ -6,15 +6,22 @@
 # For the full copyright and license information, please view
 # the LICENSE.txt file that was distributed with this source code.
 
+import array
 import os
+import sys
+from datetime import timedelta
+from decimal import Decimal
+from importlib.util import find_spec
 from urllib.parse import quote
 
 import pytest
 
-from environ import Env, Path
+from environ import ArrayCast, Env, FileAwareEnv, FrozenEnviron, Path
 from environ.compat import (
     DJANGO_POSTGRES,
     ImproperlyConfigured,
+    JSON_BACKEND,
+    JSON_BACKENDS,
     REDIS_DRIVER,
 )
 from .asserts import assert_type_and_value
@@ -107,6 +114,72 @@ class TestEnv:
         assert_type_and_value(float, value, self.env.float(variable))
         assert_type_and_value(float, value, self.env(variable, cast=float))
 
+    @pytest.mark.parametrize(
+        'value,expected',
+        [
+            ('0.25', 0.25),
+            (' -1.5 ', -1.5),
+            ('1e-3', 0.001),
+            ('1_000.5', 1000.5),
+            ('33,3', 33.3),
+            ('$ 1.234,5', 1234.5),
+        ]
+    )
+    def test_float_parsing(self, value, expected):
+        assert self.env.parse_value(value, float) == expected
+
+    def test_array(self):
+        value = self.env.array('INT_LIST', 'q')
+        assert value == array.array('q', [42, 33])
+        assert value.typecode == 'q'
+        assert self.env.array('INT_LIST') == array.array('d', [42.0, 33.0])
+        assert self.env.array('MISSING', default='1,,2.5') == \
+            array.array('d', [1.0, 2.5])
+        default = array.array('i')
+        assert self.env.array('MISSING', 'i', default=default) is default
+        with pytest.raises(ValueError):
+            self.env.array('STR_LIST_WITH_SPACES', 'q')
+
+    def test_array_cast_in_scheme(self):
+        cast = ArrayCast('i')
+        assert cast == ArrayCast('i')
+        assert hash(cast) == hash(ArrayCast('i'))
+        assert cast != ArrayCast('i', numpy=True)
+        self.env.scheme = {'INT_LIST': cast}
+        assert self.env('INT_LIST') == array.array('i', [42, 33])
+
+    def test_array_numpy(self):
+        numpy = pytest.importorskip('numpy')
+        value = self.env.array('INT_LIST', 'q', numpy=True)
+        assert isinstance(value, numpy.ndarray)
+        assert value.dtype == numpy.dtype('q')
+        assert value.tolist() == [42, 33]
+        assert self.env.parse_value(',1.5,,2,', ArrayCast(numpy=True)) \
+            .tolist() == [1.5, 2.0]
+        with pytest.raises(ValueError):
+            self.env.parse_value('1,x', ArrayCast(numpy=True))
+        with pytest.raises(ValueError):
+            self.env.parse_value('1,x', ArrayCast('q', numpy=True))
+
+    def test_array_numpy_overflow(self):
+        pytest.importorskip('numpy')
+        with pytest.raises(OverflowError):
+            ArrayCast('i', numpy=True)('1,99999999999')
+        with pytest.raises(OverflowError):
+            ArrayCast('B', numpy=True)('-1')
+        assert ArrayCast('B', numpy=True)(',255,0,').tolist() == [255, 0]
+
+    def test_array_numpy_missing(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+        with pytest.raises(ImproperlyConfigured):
+            self.env.array('INT_LIST', numpy=True)
+
+    def test_float_without_separator_fallback(self, monkeypatch):
+        monkeypatch.setattr(Env, 'FLOAT_SEPARATOR_FALLBACK', False)
+        assert self.env.float('FLOAT_VAR') == 33.3
+        with pytest.raises(ValueError):
+            self.env.float('FLOAT_COMMA_VAR')
+
     @pytest.mark.parametrize(
         'value,variable',
         [
@@ -209,6 +282,9 @@ class TestEnv:
             ('a=uname;c=http://www.google.com;b=True',
              dict(value=str, cast=dict(b=bool)),
              {'a': "uname", 'c': "http://www.google.com", 'b': True}),
+            ('a=x=1;b="1;2";c=3', dict(value=str, cast=dict(b=[str], c=int)),
+             {'a': 'x=1', 'b': ['1;2'], 'c': 3}),
+            ('1=on;2=off', dict(key=int, value=bool), {1: True, 2: False}),
         ],
         ids=[
             'dict',
@@ -218,11 +294,52 @@ class TestEnv:
             'dict_int_list',
             'dict_int_cast',
             'dict_str_cast',
+            'dict_quoted_cast',
+            'dict_key_cast',
         ],
     )
     def test_dict_parsing(self, value, cast, expected):
         assert self.env.parse_value(value, cast) == expected
 
+    def test_register_cast(self, monkeypatch):
+        monkeypatch.setattr(Env, 'CAST_PARSERS', {})
+
+        @Env.register_cast(timedelta)
+        def parse_timedelta(value):
+            return timedelta(seconds=int(value))
+
+        assert Env.CAST_PARSERS == {timedelta: parse_timedelta}
+        assert self.env('INT_VAR', cast=timedelta) == timedelta(seconds=42)
+        assert self.env.parse_value('1,2', [timedelta]) == [
+            timedelta(seconds=1), timedelta(seconds=2),
+        ]
+
+        # Registered parsers take precedence over the built-in casts.
+        self.env.register_cast(bool, lambda value: value == 'yes')
+        assert self.env.parse_value('yes', bool) is True
+        assert self.env.parse_value('true', bool) is False
+        assert self.env.parse_value('1', [bool]) == [False]
+
+    def test_register_cast_on_subclass(self, monkeypatch):
+        monkeypatch.setattr(Env, 'CAST_PARSERS', {})
+
+        class CustomEnv(Env):
+            pass
+
+        CustomEnv.register_cast(bool, lambda value: value == 'yes')
+        assert CustomEnv.parse_value('true', bool) is False
+        assert Env.CAST_PARSERS == {}
+        assert Env.parse_value('true', bool) is True
+        assert FileAwareEnv.parse_value('true', bool) is True
+        assert 'CAST_PARSERS' not in FileAwareEnv.__dict__
+
+    def test_parse_value_cast_subclass(self):
+        class IntList(list):
+            pass
+
+        assert self.env.parse_value('1,2', IntList([int])) == [1, 2]
+        assert self.env.parse_value('1', Decimal) == Decimal('1')
+
     def test_url_value(self):
         url = self.env.url('URL_VAR')
         assert url.__class__ == self.env.URL_CLASS
@@ -335,6 +452,45 @@ class TestEnv:
     def test_json_value(self):
         assert self.env.json('JSON_VAR') == FakeEnv.JSON
 
+    @pytest.mark.parametrize(
+        'backend', [name for name in JSON_BACKENDS if find_spec(name)]
+    )
+    def test_json_backend(self, monkeypatch, backend):
+        monkeypatch.setattr(Env, 'JSON_BACKEND', backend)
+        assert self.env.json('JSON_VAR') == FakeEnv.JSON
+
+    def test_json_default_backend(self):
+        assert Env.JSON_BACKEND == JSON_BACKEND
+        assert JSON_BACKEND in ('simplejson', 'json')
+
+    def test_json_cache_copy(self):
+        # Values cached by cache_values are shared on purpose.
+        self.env.cache_values = False
+        value = self.env.json('JSON_VAR')
+        value['one'] = 'changed'
+        assert self.env.json('JSON_VAR') == FakeEnv.JSON
+        assert self.env.parse_value('[{"a": [1]}]', Env.json_cast()) == \
+            [{'a': [1]}]
+
+    def test_json_cache_freeze(self, monkeypatch):
+        monkeypatch.setattr(Env, 'JSON_CACHE', 'freeze')
+        value = self.env.json('JSON_VAR')
+        assert value == FakeEnv.JSON
+        assert value is self.env.json('JSON_VAR')
+        with pytest.raises(TypeError):
+            value['one'] = 'changed'
+        assert self.env.parse_value('{"a": [1, {}]}', Env.json_cast()) == \
+            {'a': (1, {})}
+
+    def test_json_cache_disabled(self, monkeypatch):
+        monkeypatch.setattr(Env, 'JSON_CACHE', None)
+        assert self.env.json('JSON_VAR') == FakeEnv.JSON
+
+    def test_json_cache_invalid_mode(self, monkeypatch):
+        monkeypatch.setattr(Env, 'JSON_CACHE', 'shared')
+        with pytest.raises(ImproperlyConfigured):
+            self.env.json('JSON_VAR')
+
     def test_path(self):
         root = self.env.path('PATH_VAR')
         assert_type_and_value(Path, Path(FakeEnv.PATH), root)
@@ -356,6 +512,29 @@ class TestEnv:
     def test_prefix(self):
         self.env.prefix = 'PREFIX_'
         assert self.env('TEST') == 'foo'
+        assert 'TEST' in self.env
+        assert 'PREFIX_TEST' not in self.env
+
+    def test_scoped(self):
+        scoped = self.env.scoped('PREFIX_')
+        assert scoped.prefix == 'PREFIX_'
+        assert self.env.prefix == ''
+        assert scoped('TEST') == 'foo'
+        assert list(scoped) == ['TEST']
+        assert dict(scoped) == {'TEST': 'foo'}
+
+    def test_scoped_nested(self):
+        scoped = self.env.scoped('PRE').scoped('FIX_')
+        assert scoped.prefix == 'PREFIX_'
+        assert scoped.keys() == ('TEST',)
+        assert scoped['TEST'] == 'foo'
+        with pytest.raises(KeyError):
+            scoped['MISSING']
+
+    def test_scoped_empty(self):
+        scoped = self.env.scoped('MISSING_PREFIX_')
+        assert dict(scoped) == {}
+        assert scoped.str('TEST', default='default') == 'default'
 
 
 class TestFileEnv(TestEnv):
@@ -431,3 +610,177 @@ class TestSubClass(TestEnv):
 
     def test_singleton_environ(self):
         assert self.CONFIG is self.env.ENVIRON
+
+
+class TestCachedEnv(TestEnv):
+    def setup_method(self, method):
+        """
+        Setup environment variables.
+
+        Setup any state tied to the execution of the given method in a
+        class.  setup_method is invoked for every test method of a class.
+        """
+        super().setup_method(method)
+        self.env.cache_values = True
+
+    def test_cached_value(self):
+        value = self.env.list('INT_LIST', cast=int)
+        assert self.env.list('INT_LIST', cast=int) == value
+        assert self.env.json('JSON_VAR') is self.env.json('JSON_VAR')
+
+        Env.ENVIRON['JSON_VAR'] = '{}'
+        assert self.env.json('JSON_VAR') == FakeEnv.JSON
+
+        Env.environ_changed()
+        assert self.env.json('JSON_VAR') == {}
+
+    def test_cache_invalidated_by_read_env(self):
+        assert self.env('STR_VAR') == 'bar'
+        self.env.read_env(['STR_VAR=baz\n'], stream=True, overwrite=True)
+        assert self.env('STR_VAR') == 'baz'
+
+    def test_cache_invalidated_by_new_environ(self):
+        assert self.env('STR_VAR') == 'bar'
+        Env.ENVIRON = dict(Env.ENVIRON, STR_VAR='baz')
+        assert self.env('STR_VAR') == 'baz'
+
+    def test_cache_invalidated_by_added_or_removed_variables(self):
+        assert self.env('NEW_VAR', default='default') == 'default'
+        Env.ENVIRON['NEW_VAR'] = 'set'
+        assert self.env('NEW_VAR', default='default') == 'set'
+        del Env.ENVIRON['NEW_VAR']
+        assert self.env('NEW_VAR', default='default') == 'default'
+
+    def test_cache_invalidated_by_scheme(self):
+        env = Env(INT_VAR=int)
+        env.cache_values = True
+        assert env('INT_VAR') == 42
+
+        env.scheme = {'INT_VAR': float}
+        assert isinstance(env('INT_VAR'), float)
+
+        env.scheme['INT_VAR'] = str
+        assert env('INT_VAR') == '42'
+
+        scoped = env.scoped('')
+        assert scoped('INT_VAR') == '42'
+        env.scheme['INT_VAR'] = int
+        assert scoped('INT_VAR') == 42
+        assert env('INT_VAR') == 42
+
+        del env.scheme['INT_VAR']
+        assert env('INT_VAR') == '42'
+
+    def test_cached_defaults_of_equal_value(self):
+        values = [
+            self.env('MISSING', default=default)
+            for default in (1, True, 1.0)
+        ]
+        assert [type(value) for value in values] == [int, bool, float]
+
+    def test_clear_cache(self):
+        assert self.env('TEST', default='default') == 'default'
+        self.env.prefix = 'PREFIX_'
+        self.env.clear_cache()
+        assert self.env('TEST', default='default') == 'foo'
+
+
+class TestSnapshotEnv(TestEnv):
+    def setup_method(self, method):
+        """
+        Setup environment variables.
+
+        Setup any state tied to the execution of the given method in a
+        class.  setup_method is invoked for every test method of a class.
+        """
+        super().setup_method(method)
+        self.env.snapshot()
+
+    def test_snapshot(self):
+        assert isinstance(self.env.ENVIRON, FrozenEnviron)
+        assert self.env.ENVIRON['STR_VAR'] == Env.ENVIRON['STR_VAR']
+        snapshot = self.env.ENVIRON
+        assert hash(snapshot) == hash(FrozenEnviron(dict(snapshot)))
+
+        with pytest.raises(TypeError):
+            self.env.ENVIRON['STR_VAR'] = 'baz'
+
+    def test_refresh(self):
+        before = self.env.ENVIRON
+        Env.ENVIRON['STR_VAR'] = 'baz'
+        Env.read_env(['NEW_VAR=new\n'], stream=True)
+        assert self.env('STR_VAR') == 'bar'
+        assert 'NEW_VAR' not in self.env
+
+        after = self.env.refresh()
+        assert self.env('STR_VAR') == 'baz'
+        assert 'NEW_VAR' in self.env
+        changes = dict(after.items() - before.items())
+        # pytest keeps PYTEST_CURRENT_TEST up to date in os.environ.
+        changes.pop('PYTEST_CURRENT_TEST', None)
+        assert changes == {'STR_VAR': 'baz', 'NEW_VAR': 'new'}
+
+
+class TestScopedEnv:
+    def setup_method(self, method):
+        self.old_environ = os.environ
+        self.old_env_environ = Env.ENVIRON
+        os.environ = Env.ENVIRON = {
+            'APP_DEBUG': 'on',
+            'APP_DB_HOST': 'localhost',
+            'APP_DB_PORT': '5432',
+            'OTHER': 'value',
+        }
+        self.env = Env()
+
+    def teardown_method(self, method):
+        os.environ = self.old_environ
+        Env.ENVIRON = self.old_env_environ
+
+    def test_iteration(self):
+        app = self.env.scoped('APP_')
+        assert sorted(app) == ['DB_HOST', 'DB_PORT', 'DEBUG']
+        assert dict(app.scoped('DB_')) == {
+            'HOST': 'localhost', 'PORT': '5432',
+        }
+        assert app.bool('DEBUG') is True
+        assert app.scoped('DB_').int('PORT') == 5432
+
+    def test_index_is_shared(self):
+        app = self.env.scoped('APP_')
+        db = app.scoped('DB_')
+        assert app.keys() is app.keys()
+        list(db)
+        assert Env._environ_index[0] is Env.ENVIRON
+        assert Env._environ_index[2] == sorted(Env.ENVIRON)
+
+    def test_index_follows_environ(self):
+        app = self.env.scoped('APP_')
+        assert 'NAME' not in app.keys()
+
+        Env.read_env(['APP_NAME=demo\n'], stream=True)
+        assert 'NAME' in app.keys()
+
+        Env.ENVIRON.pop('APP_NAME')
+        Env.environ_changed()
+        assert 'NAME' not in app.keys()
+
+        Env.ENVIRON = {'APP_ONLY': '1'}
+        assert list(app) == ['ONLY']
+
+    def test_index_follows_direct_changes(self):
+        app = self.env.scoped('APP_')
+        assert 'DEBUG' in app.keys()
+
+        del Env.ENVIRON['APP_DEBUG']
+        assert dict(app) == {'DB_HOST': 'localhost', 'DB_PORT': '5432'}
+
+        Env.ENVIRON['APP_NAME'] = 'demo'
+        assert dict(app) == {
+            'DB_HOST': 'localhost', 'DB_PORT': '5432', 'NAME': 'demo',
+        }
+
+        # Same number of variables, one of the scope replaced.
+        del Env.ENVIRON['APP_NAME']
+        Env.ENVIRON['OTHER_NAME'] = 'demo'
+        assert dict(app) == {'DB_HOST': 'localhost', 'DB_PORT': '5432'}
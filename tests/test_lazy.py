@@ -0,0 +1,104 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+import copy
+import pickle
+
+import pytest
+
+from environ import Env, LazyValue
+from environ.compat import ImproperlyConfigured
+from .fixtures import FakeEnv
+
+
+class FakeEnvironEnv(Env):
+    ENVIRON = FakeEnv.generate_data()
+
+
+def test_resolved_once():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return [1, 2]
+
+    value = LazyValue(factory, name='LIST')
+    assert repr(value) == "<LazyValue: 'LIST'>"
+    assert not value.resolved
+    assert calls == []
+
+    assert value == [1, 2]
+    assert len(value) == 2
+    assert list(value) == [1, 2]
+    assert value.resolved
+    assert repr(value) == '[1, 2]'
+    assert calls == [1]
+
+
+def test_proxied_operations():
+    number = LazyValue(lambda: 42)
+    assert number + 1 == 43
+    assert 1 + number == 43
+    assert number * 2 == 84
+    assert 84 / number == 2
+    assert int(number) == 42
+    assert float(number) == 42.0
+    assert [0] * 3 == [0] * LazyValue(lambda: 3)
+    assert f'{number:04d}' == '0042'
+    assert isinstance(number, int)
+
+    text = LazyValue(lambda: 'foo')
+    assert str(text) == 'foo'
+    assert 'o' in text
+    assert text.upper() == 'FOO'
+    assert text[0] == 'f'
+    assert '%s!' % text == 'foo!'
+    assert hash(text) == hash('foo')
+    assert not LazyValue(lambda: '')
+
+
+def test_copy_and_pickle():
+    value = LazyValue(lambda: {'a': 1})
+    assert copy.deepcopy(value) == {'a': 1}
+    assert type(pickle.loads(pickle.dumps(value))) is dict
+
+
+def test_env_lazy():
+    env = FakeEnvironEnv()
+    value = env.lazy('INT_VAR', cast=int)
+    missing = env.lazy('NOT_PRESENT_VAR')
+
+    env.ENVIRON = dict(env.ENVIRON, INT_VAR='43')
+    assert value == 43
+
+    with pytest.raises(ImproperlyConfigured):
+        str(missing)
+
+
+def test_env_resolve_all():
+    env = FakeEnvironEnv()
+    int_var = env.lazy('INT_VAR', cast=int)
+    env.lazy('STR_VAR', cast=int)
+    env.lazy('NOT_PRESENT_VAR')
+
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        env.resolve_all()
+    assert set(excinfo.value.errors) == {'STR_VAR', 'NOT_PRESENT_VAR'}
+    assert int_var.resolved
+
+
+def test_env_keeps_only_unresolved_values():
+    env = FakeEnvironEnv()
+    values = [env.lazy('INT_VAR', cast=int) for _ in range(100)]
+    assert values[0] == 42
+    assert len(env._lazy_values) == 99
+
+    missing = env.lazy('NOT_PRESENT_VAR')
+    with pytest.raises(ImproperlyConfigured):
+        env.resolve_all()
+    assert list(env._lazy_values.values()) == [missing]
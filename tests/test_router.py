@@ -0,0 +1,129 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+import asyncio
+import threading
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from environ import ReplicaRouter
+from environ.compat import ImproperlyConfigured
+from environ import router as router_module
+from environ.router import _ThreadPin, _weighted_order
+
+
+def replica(weight=None, mirror='default'):
+    config = {'TEST': {'MIRROR': mirror}}
+    if weight is not None:
+        config['WEIGHT'] = weight
+    return config
+
+
+def instance(db):
+    return SimpleNamespace(_state=SimpleNamespace(db=db))
+
+
+@pytest.fixture(autouse=True)
+def unpin():
+    ReplicaRouter.unpin()
+    yield
+    ReplicaRouter.unpin()
+
+
+def test_weighted_order():
+    assert _weighted_order({'a': 2, 'b': 1}) == ['a', 'b', 'a']
+    assert _weighted_order({'a': 20, 'b': 10}) == ['a', 'b', 'a']
+    assert Counter(_weighted_order({'a': 5, 'b': 3, 'c': 1})) == {
+        'a': 5, 'b': 3, 'c': 1,
+    }
+
+
+def test_reads_use_weighted_replicas():
+    router = ReplicaRouter({
+        'default': {},
+        'replica1': replica(3),
+        'replica2': replica(),
+        'drained': replica(0),
+        'analytics': {},
+        'other': replica(mirror='analytics'),
+    })
+    assert router.replicas == {'replica1', 'replica2', 'drained'}
+    reads = [router.db_for_read(None) for _ in range(8)]
+    assert Counter(reads) == {'replica1': 6, 'replica2': 2}
+
+
+def test_reads_without_replicas():
+    router = ReplicaRouter({'default': {}, 'drained': replica(0)})
+    assert router.db_for_read(None) == 'default'
+
+
+def test_writes_pin_reads_to_primary(monkeypatch):
+    router = ReplicaRouter({'default': {}, 'replica': replica()})
+    assert router.db_for_read(None) == 'replica'
+    assert not ReplicaRouter.is_pinned()
+
+    assert router.db_for_write(None) == 'default'
+    assert ReplicaRouter.is_pinned()
+    assert router.db_for_read(None) == 'default'
+
+    ReplicaRouter.unpin()
+    assert router.db_for_read(None) == 'replica'
+
+    monkeypatch.setattr(ReplicaRouter, 'pin_seconds', 0)
+    router.db_for_write(None)
+    assert router.db_for_read(None) == 'replica'
+
+
+def test_pin_is_per_context():
+    router = ReplicaRouter({'default': {}, 'replica': replica()})
+
+    async def write():
+        router.db_for_write(None)
+        return router.db_for_read(None)
+
+    async def main():
+        return await asyncio.gather(write(), asyncio.sleep(0))
+
+    assert asyncio.run(main())[0] == 'default'
+    assert router.db_for_read(None) == 'replica'
+
+
+def test_pin_is_per_thread_without_contextvars(monkeypatch):
+    monkeypatch.setattr(router_module, '_pinned_until', _ThreadPin())
+    router = ReplicaRouter({'default': {}, 'replica': replica()})
+    router.db_for_write(None)
+
+    reads = []
+    thread = threading.Thread(
+        target=lambda: reads.append(router.db_for_read(None))
+    )
+    thread.start()
+    thread.join()
+    assert reads == ['replica']
+    assert router.db_for_read(None) == 'default'
+
+
+def test_allow_relation_and_migrate():
+    router = ReplicaRouter({
+        'default': {}, 'replica': replica(), 'analytics': {},
+    })
+    assert router.allow_relation(instance('default'), instance('replica'))
+    assert router.allow_relation(
+        instance('default'), instance('analytics')) is None
+    assert router.allow_migrate('replica', 'app') is False
+    assert router.allow_migrate('default', 'app') is None
+    assert router.allow_migrate('analytics', 'app') is None
+
+
+@pytest.mark.parametrize('weight', [-1, 'heavy'])
+def test_invalid_weight(weight):
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        ReplicaRouter({'default': {}, 'replica': replica(weight)})
+    assert "WEIGHT of database 'replica'" in str(excinfo.value)
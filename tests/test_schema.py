@@ -8,7 +8,10 @@
 
 import os
 
+import pytest
+
 from environ import Env
+from environ.compat import ImproperlyConfigured
 from .fixtures import FakeEnv
 
 _old_environ = None
@@ -52,3 +55,92 @@ def test_schema():
     # Override schema in this one case
     assert isinstance(env('INT_VAR', cast=str), str)
     assert env('INT_VAR', cast=str) == '42'
+
+
+def test_schema_reassigned():
+    env = Env(INT_VAR=int)
+    env.scheme = dict(INT_VAR=(str, 'default'), NOT_PRESENT_VAR=([int], [1]))
+
+    assert env('INT_VAR') == '42'
+    assert env('NOT_PRESENT_VAR') == [1]
+    assert env.scheme == dict(
+        INT_VAR=(str, 'default'),
+        NOT_PRESENT_VAR=([int], [1]),
+    )
+
+
+def test_schema_mutated_in_place():
+    env = Env(INT_VAR=int)
+    assert env('INT_VAR') == 42
+    env.scheme['INT_VAR'] = (str, 'default')
+    env.scheme['NOT_PRESENT_VAR'] = (int, 0)
+    assert env('INT_VAR') == '42'
+    assert env('NOT_PRESENT_VAR') == 0
+    del env.scheme['INT_VAR']
+    assert env('INT_VAR') == '42'
+    assert env('NOT_PRESENT_VAR') == 0
+
+
+def test_schema_single_item_tuple_is_cast():
+    env = Env(INT_LIST=(int,))
+    assert env('INT_LIST') == (42, 33)
+
+
+def test_load():
+    env = Env(INT_VAR=int, NOT_PRESENT_VAR=(float, 33.3), STR_VAR=str)
+    assert env.load() == {
+        'INT_VAR': 42,
+        'NOT_PRESENT_VAR': 33.3,
+        'STR_VAR': 'bar',
+    }
+
+    values = env.load({
+        'INT_LIST': [int],
+        'DEFAULT_LIST': ([int], [2]),
+        'PROXIED_VAR': None,
+        'DATABASE_URL': Env.db_url_config,
+    })
+    assert values['INT_LIST'] == [42, 33]
+    assert values['DEFAULT_LIST'] == [2]
+    assert values['PROXIED_VAR'] == 'bar'
+    assert values['DATABASE_URL']['NAME'] == 'd8r82722'
+
+
+def test_load_with_prefix():
+    env = Env(PREFIX_TEST=str)
+    env.prefix = 'PREFIX_'
+    assert env.load() == {'TEST': 'foo'}
+    assert env.load({'TEST': str}) == {'TEST': 'foo'}
+
+
+def test_load_with_prefix_skips_unprefixed_variables():
+    env = Env(PREFIX_TEST=str, INT_VAR=int)
+    env.prefix = 'PREFIX_'
+    assert env.load() == {'TEST': 'foo'}
+
+
+def test_load_with_names():
+    env = Env()
+    values = env.load(
+        {'port': int, 'raw_port': str, 'STR_VAR': str},
+        names={'port': 'INT_VAR', 'raw_port': 'INT_VAR'},
+    )
+    assert values == {'port': 42, 'raw_port': '42', 'STR_VAR': 'bar'}
+
+
+def test_load_reports_all_errors():
+    env = Env()
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        env.load({
+            'INT_VAR': int,
+            'STR_VAR': int,
+            'NOT_PRESENT_VAR': str,
+            'URL_VAR': Env.cache_url_config,
+        })
+
+    errors = excinfo.value.errors
+    assert set(errors) == {'STR_VAR', 'NOT_PRESENT_VAR', 'URL_VAR'}
+    assert isinstance(errors['STR_VAR'], ValueError)
+    message = str(excinfo.value)
+    assert 'NOT_PRESENT_VAR: Set the NOT_PRESENT_VAR environment variable' in message
+    assert 'URL_VAR: Invalid cache schema http' in message
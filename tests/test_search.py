@@ -143,3 +143,15 @@ def test_common_args_parsing(search_url):
     assert url['INCLUDE_SPELLING']
     assert 'BATCH_SIZE' in url.keys()
     assert url['BATCH_SIZE'] == 100
+
+
+def test_url_config_cache_follows_casts(monkeypatch, url_config_cache):
+    url = 'solr://127.0.0.1:8983/solr?INCLUDE_SPELLING=enabled&TIMEOUT=30'
+    assert Env.search_url_config(url)['INCLUDE_SPELLING'] is False
+
+    monkeypatch.setattr(Env, 'BOOLEAN_TRUE_STRINGS', ('enabled',))
+    assert Env.search_url_config(url)['INCLUDE_SPELLING'] is True
+
+    monkeypatch.setattr(Env, 'CAST_PARSERS', {})
+    Env.register_cast(int, lambda value: int(value) * 1000)
+    assert Env.search_url_config(url)['TIMEOUT'] == 30000
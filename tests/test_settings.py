@@ -0,0 +1,87 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+import pytest
+
+import environ
+from environ.compat import ImproperlyConfigured
+from .fixtures import FakeEnv
+
+
+class FakeEnvironEnv(environ.Env):
+    ENVIRON = FakeEnv.generate_data()
+
+
+class AppSettings(environ.Settings):
+    int_var = environ.Var(int)
+    str_var = environ.Var(str, default='default')
+    missing = environ.Var(float, default=33.3, var='NOT_PRESENT_VAR')
+    database = environ.Var(environ.Env.db_url_config, var='DATABASE_URL')
+
+
+class ExtendedSettings(AppSettings):
+    int_list = environ.Var([int])
+
+
+def test_settings():
+    settings = AppSettings(env=FakeEnvironEnv())
+    assert settings.int_var == 42
+    assert settings.str_var == 'bar'
+    assert settings.missing == 33.3
+    assert settings.database['NAME'] == 'd8r82722'
+    assert settings.as_dict()['int_var'] == 42
+
+
+def test_settings_use_slots():
+    settings = AppSettings(env=FakeEnvironEnv())
+    assert not hasattr(settings, '__dict__')
+    assert AppSettings.__slots__ == ('int_var', 'str_var', 'missing',
+                                     'database')
+    assert isinstance(AppSettings.int_var, type(AppSettings._env))
+
+
+def test_settings_inheritance():
+    settings = ExtendedSettings(env=FakeEnvironEnv())
+    assert settings.int_var == 42
+    assert settings.int_list == [42, 33]
+    assert list(ExtendedSettings._fields) == [
+        'int_var', 'str_var', 'missing', 'database', 'int_list',
+    ]
+
+
+def test_settings_report_all_errors():
+    class BrokenSettings(environ.Settings):
+        str_var = environ.Var(int)
+        missing = environ.Var(str)
+
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        BrokenSettings(env=FakeEnvironEnv())
+    assert set(excinfo.value.errors) == {'str_var', 'missing'}
+
+
+def test_settings_fields_sharing_a_variable():
+    class SharedSettings(environ.Settings):
+        int_var = environ.Var(int)
+        raw_int_var = environ.Var(str, var='INT_VAR')
+
+    settings = SharedSettings(env=FakeEnvironEnv())
+    assert settings.int_var == 42
+    assert settings.raw_int_var == '42'
+
+
+def test_lazy_settings():
+    env = FakeEnvironEnv()
+    settings = ExtendedSettings(env=env, lazy=True)
+    env.ENVIRON = dict(env.ENVIRON, INT_VAR='43')
+    assert settings.int_var == 43
+
+    env.ENVIRON = dict(env.ENVIRON, INT_VAR='44')
+    assert settings.int_var == 43
+
+    with pytest.raises(AttributeError):
+        settings.unknown
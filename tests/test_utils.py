@@ -6,9 +6,18 @@
 # For the full copyright and license information, please view
 # the LICENSE.txt file that was distributed with this source code.
 
+from unittest import mock
+
 import pytest
 
-from environ.environ import _cast, _cast_urlstr
+import environ.compat
+from environ.environ import (
+    _cast,
+    _cast_urlstr,
+    _iter_dict_entries,
+    _parse_env_line,
+)
+from .asserts import assert_linear
 
 
 @pytest.mark.parametrize(
@@ -23,6 +32,56 @@ def test_cast(literal):
     assert _cast(literal) == literal
 
 
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('600', 600),
+        ('-1', -1),
+        ('1_000', 1000),
+        ('0x1f', 31),
+        ('1.5', 1.5),
+        ('1e3', 1000.0),
+        ('True', True),
+        ('False', False),
+        ('None', None),
+        ('"quoted"', 'quoted'),
+        ("'it\\'s'", "it's"),
+        ('true', 'true'),
+        ('010', '010'),
+        ('[1, 2]', '[1, 2]'),
+        ('{"a": 1}', '{"a": 1}'),
+        ('(1,)', '(1,)'),
+        ("b'x'", "b'x'"),
+        ('', ''),
+    ]
+)
+def test_cast_scalars(value, expected):
+    result = _cast(value)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    'value,hint,expected',
+    [
+        ('600', int, 600),
+        ('None', int, None),
+        ('010', int, 10),
+        ('abc', int, 'abc'),
+        ('true', bool, True),
+        ('Off', bool, False),
+        ('0', bool, False),
+        ('maybe', bool, 'maybe'),
+        ('1', str, '1'),
+        ('1', float, 1.0),
+    ]
+)
+def test_cast_with_hint(value, hint, expected):
+    result = _cast(value, hint)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
 @pytest.mark.parametrize(
     "quoted_url_str,expected_unquoted_str",
     [
@@ -39,3 +98,82 @@ def test_cast_urlstr(quoted_url_str, expected_unquoted_str):
     related to https://github.com/joke2k/django-environ/pull/69"""
 
     assert _cast_urlstr(quoted_url_str) == expected_unquoted_str
+
+
+@pytest.mark.parametrize(
+    'line,expected',
+    [
+        ('KEY=value', ('KEY', 'value')),
+        ('export KEY=value', ('KEY', 'value')),
+        ('KEY=', ('KEY', '')),
+        ('KEY=value # comment', ('KEY', 'value ')),
+        ("KEY= 'value' # comment", ('KEY', 'value')),
+        ("KEY='value # with hash' # comment", ('KEY', 'value # with hash')),
+        ("KEY='it's' ", ('KEY', "it's")),
+        ('KEY="a\\nb\\$c"', ('KEY', 'a\\nb$c')),
+        ('KEY="unterminated', ('KEY', '"unterminated')),
+        ('KEY=a=b', ('KEY', 'a=b')),
+        ('# comment', None),
+        ('', None),
+        ('=value', None),
+        ('KEY value', None),
+        ('BAD-KEY=value', None),
+        ('export  KEY=value', None),
+    ]
+)
+def test_parse_env_line(line, expected):
+    assert _parse_env_line(line) == expected
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('a=1;b=2', [('a', '1'), ('b', '2')]),
+        (';a=1;;b=;', [('a', '1'), ('b', '')]),
+        ('a=b=c', [('a', 'b=c')]),
+        ('url=http://host/?x=1&y=2', [('url', 'http://host/?x=1&y=2')]),
+        ('a="x;y=z";b=2', [('a', 'x;y=z'), ('b', '2')]),
+        ("a='it\\'s'", [('a', "it's")]),
+        ('"k;1"=v', [('k;1', 'v')]),
+        ('a=x\\;y;b=2', [('a', 'x;y'), ('b', '2')]),
+        ('path=C:\\dir', [('path', 'C:\\dir')]),
+        ("name=O'Brien;b=it's 'q'", [('name', "O'Brien"), ('b', "it's 'q'")]),
+        ('a="open;b=2', [('a', '"open'), ('b', '2')]),
+    ]
+)
+def test_iter_dict_entries(value, expected):
+    assert list(_iter_dict_entries(value)) == expected
+
+
+@pytest.mark.parametrize('value', ['a=1;b', 'a=1;"b"'])
+def test_iter_dict_entries_without_value(value):
+    with pytest.raises(ValueError):
+        list(_iter_dict_entries(value))
+
+
+@pytest.mark.parametrize(
+    'make_value',
+    [
+        lambda n: ';'.join('key%d=value%d' % (i, i) for i in range(n)),
+        lambda n: ';'.join('key%d="va;lue"' % i for i in range(n)),
+        lambda n: 'a="x\\";' * n,
+    ],
+    ids=['plain', 'quoted', 'unterminated_quotes'],
+)
+def test_iter_dict_entries_is_linear(make_value):
+    assert_linear(lambda value: list(_iter_dict_entries(value)), make_value)
+
+
+@pytest.mark.parametrize(
+    'installed,expected',
+    [
+        ({'orjson', 'ujson', 'simplejson'}, 'simplejson'),
+        ({'orjson', 'ujson'}, 'json'),
+        ({'simplejson'}, 'simplejson'),
+        (set(), 'json'),
+    ]
+)
+def test_choose_json_backend(installed, expected):
+    with mock.patch('environ.compat.find_spec') as mock_find_spec:
+        mock_find_spec.side_effect = lambda name: name in installed
+        assert environ.compat.choose_json_backend() == expected
@@ -0,0 +1,102 @@
+# This file is part of the django-environ.
+#
+# Copyright (c) 2021-2022, Serghei Iakovlev <egrep@protonmail.ch>
+# Copyright (c) 2013-2021, Daniele Faraglia <daniele.faraglia@gmail.com>
+#
+# For the full copyright and license information, please view
+# the LICENSE.txt file that was distributed with this source code.
+
+import os
+import threading
+
+import pytest
+
+import environ
+
+
+class FakeEnv(environ.Env):
+    ENVIRON = {}
+
+
+@pytest.fixture
+def env(monkeypatch):
+    monkeypatch.setattr(FakeEnv, 'ENVIRON', {'EXISTING': 'process'})
+    return FakeEnv
+
+
+def write(path, content):
+    """Rewrite ``path`` and make sure its modification time moves on."""
+    mtime = os.stat(str(path)).st_mtime_ns if path.exists() else 0
+    path.write_text(content)
+    os.utime(str(path), ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+
+def test_initial_load(env, tmp_path):
+    env_file = tmp_path / '.env'
+    write(env_file, 'A=1\nEXISTING=file\n')
+    watcher = environ.EnvWatcher(env_file, env=env)
+    assert watcher.values == {'A': '1', 'EXISTING': 'file'}
+    assert env.ENVIRON == {'A': '1', 'EXISTING': 'process'}
+
+
+def test_check_reports_changed_keys(env, tmp_path):
+    env_file = tmp_path / '.env'
+    write(env_file, 'A=1\nB=2\nEXISTING=file\n')
+    watcher = environ.EnvWatcher(env_file, env=env)
+    calls = []
+    watcher.add_callback(calls.append)
+
+    assert watcher.check() == set()
+    write(env_file, 'A=1\nB=3\nC=4\nEXISTING=changed\n')
+    assert watcher.check() == {'B', 'C', 'EXISTING'}
+    assert env.ENVIRON == {'A': '1', 'B': '3', 'C': '4', 'EXISTING': 'process'}
+
+    write(env_file, 'B=3\nC=4\n')
+    assert watcher.check() == {'A', 'EXISTING'}
+    assert env.ENVIRON == {'B': '3', 'C': '4', 'EXISTING': 'process'}
+    assert calls == [{'B', 'C', 'EXISTING'}, {'A', 'EXISTING'}]
+
+
+def test_overwrite(env, tmp_path):
+    env_file = tmp_path / '.env'
+    write(env_file, 'EXISTING=file\n')
+    environ.EnvWatcher(env_file, env=env, overwrite=True)
+    assert env.ENVIRON == {'EXISTING': 'file'}
+
+
+def test_missing_file_keeps_values(env, tmp_path):
+    env_file = tmp_path / '.env'
+    write(env_file, 'A=1\n')
+    watcher = environ.EnvWatcher(env_file, env=env)
+    env_file.unlink()
+    assert watcher.check() == set()
+    assert env.ENVIRON['A'] == '1'
+
+
+def test_failing_callback_does_not_stop_others(env, tmp_path):
+    env_file = tmp_path / '.env'
+    write(env_file, 'A=1\n')
+    watcher = environ.EnvWatcher(env_file, env=env)
+    calls = []
+
+    @watcher.add_callback
+    def fail(keys):
+        raise RuntimeError(keys)
+
+    watcher.add_callback(calls.append)
+    write(env_file, 'A=2\n')
+    watcher.check()
+    assert calls == [{'A'}]
+
+
+def test_background_thread(env, tmp_path):
+    env_file = tmp_path / '.env'
+    write(env_file, 'A=1\n')
+    reloaded = threading.Event()
+
+    with environ.EnvWatcher(env_file, env=env, interval=0.01) as watcher:
+        watcher.add_callback(lambda keys: reloaded.set())
+        write(env_file, 'A=2\n')
+        assert reloaded.wait(5)
+    assert watcher._thread is None
+    assert env.ENVIRON['A'] == '2'